@@ -868,16 +868,9 @@ def list_datasets():
             }
             dataset['last_modified'] = datetime.fromisoformat(dataset['updated']).strftime('%Y-%m-%d %H:%M:%S')
             
-            # Add validation status if available
-            try:
-                validation_results = dataset_manager.validate_dataset(dataset['name'])
-                dataset['validation_status'] = {
-                    'valid': validation_results['valid'],
-                    'error_count': len(validation_results.get('errors', [])),
-                    'last_validated': datetime.now().isoformat()
-                }
-            except Exception:
-                dataset['validation_status'] = None
+            # Validation parses every file, so it is reported by the dataset
+            # detail endpoint rather than for each listed dataset
+            dataset['validation_status'] = None
 
         return jsonify({
             "status": "success",
@@ -1095,7 +1088,7 @@ def delete_dataset(name):
         logger.info(f"Attempting to delete dataset: {name}")
         
         # Check if dataset exists
-        if not dataset_manager.get_dataset(name):
+        if not dataset_manager.get_dataset(name, include_files=False):
             return jsonify({
                 "status": "error",
                 "message": f"Dataset '{name}' not found"
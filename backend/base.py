@@ -11,7 +11,7 @@ Classes:
 
 from abc import ABC, abstractmethod
 from lxml import etree
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 import logging
 import os
 
@@ -30,6 +30,9 @@ class BaseTransformer(ABC):
         schema_path (Optional[str]): Path to the XML schema file
     """
     
+    # Compiled schemas shared by all transformers, keyed by path and mtime
+    _SCHEMA_CACHE: Dict[Tuple[str, int], etree._Validator] = {}
+    
     def __init__(self, schema_path: Optional[str] = None):
         """
         Initialize the base transformer.
@@ -49,13 +52,37 @@ class BaseTransformer(ABC):
                 if not os.path.exists(schema_path):
                     raise ValueError(f"Schema file not found: {schema_path}")
                     
-                schema_doc = etree.parse(schema_path)
-                self.schema = etree.XMLSchema(schema_doc)
+                self.schema = self._load_schema(schema_path)
                 self.logger.info(f"Loaded schema from {schema_path}")
             except (etree.ParseError, IOError) as e:
                 self.logger.error(f"Failed to load schema: {str(e)}")
                 raise ValueError(f"Failed to load schema: {str(e)}")
 
+    @staticmethod
+    def _load_schema(schema_path: str) -> etree._Validator:
+        """
+        Compile a schema, reusing the compiled schema if the file is unchanged.
+
+        Files ending in ``.rng`` are compiled as RelaxNG (the form MEI is
+        published in), anything else as XML Schema.
+
+        Args:
+            schema_path (str): Path to XML schema or RelaxNG file
+
+        Returns:
+            etree._Validator: Compiled schema
+        """
+        key = (os.path.abspath(schema_path), os.stat(schema_path).st_mtime_ns)
+        schema = BaseTransformer._SCHEMA_CACHE.get(key)
+        if schema is None:
+            schema_doc = etree.parse(schema_path)
+            if schema_path.lower().endswith('.rng'):
+                schema = etree.RelaxNG(schema_doc)
+            else:
+                schema = etree.XMLSchema(schema_doc)
+            BaseTransformer._SCHEMA_CACHE[key] = schema
+        return schema
+
     @abstractmethod
     def validate(self, xml_string: str) -> None:
         """
@@ -151,17 +178,19 @@ class BaseTransformer(ABC):
         """
         path_parts = []
         current = element
-        while current is not None:
-            if current.getparent() is not None:
-                siblings = current.getparent().findall(current.tag)
-                if len(siblings) > 1:
-                    index = siblings.index(current) + 1
-                    path_parts.append(f"{current.tag}[{index}]")
-                else:
-                    path_parts.append(current.tag)
+        parent = current.getparent()
+        while parent is not None:
+            # Position among same-tag siblings, counted from the neighbours
+            # instead of collecting every sibling at each level
+            tag = current.tag
+            index = sum(1 for _ in current.itersiblings(tag, preceding=True)) + 1
+            if index > 1 or next(current.itersiblings(tag), None) is not None:
+                path_parts.append(f"{tag}[{index}]")
             else:
-                path_parts.append(current.tag)
-            current = current.getparent()
+                path_parts.append(tag)
+            current = parent
+            parent = current.getparent()
+        path_parts.append(current.tag)
         return '/' + '/'.join(reversed(path_parts))
 
     def _check_required_attributes(
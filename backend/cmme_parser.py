@@ -12,11 +12,72 @@ Classes:
 from lxml import etree
 import traceback
 import re
-from typing import Dict, List, Optional, Union, Any
+import sys
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Union, Any
 from .base import BaseTransformer
 import logging
 
 
+class NoteData:
+    """
+    Compact container for a parsed note.
+
+    Uses __slots__ instead of a per-instance dict, which keeps large
+    scores parsed with ``compact_notes=True`` considerably smaller in
+    memory. ``asdict()`` returns the same dict ``_parse_note_attributes``
+    produces.
+    """
+    
+    __slots__ = ('pitch', 'duration', 'octave', 'accidental', 'stem_direction',
+                 'articulations', 'ligature', 'mensuration', 'coloration',
+                 'ficta', 'editorial')
+    
+    # Dict keys that differ from the slot name
+    _KEYS = {'stem_direction': 'stem-direction'}
+
+    def __init__(self, **attributes: Any):
+        for name in self.__slots__:
+            setattr(self, name, attributes.get(name))
+
+    @classmethod
+    def from_attributes(cls, attrs: Dict[str, Any]) -> 'NoteData':
+        """
+        Build a NoteData from a parsed note attribute dict.
+
+        Args:
+            attrs (Dict[str, Any]): Note attributes as parsed
+
+        Returns:
+            NoteData: Compact note
+        """
+        note = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(note, name, attrs.get(cls._KEYS.get(name, name)))
+        return note
+
+    def asdict(self) -> Dict[str, Any]:
+        """
+        Convert back to the parsed note attribute dict.
+
+        Returns:
+            Dict[str, Any]: Note attributes
+        """
+        attrs = {'pitch': self.pitch, 'duration': self.duration}
+        for name in self.__slots__[2:]:
+            value = getattr(self, name)
+            if value is not None:
+                attrs[self._KEYS.get(name, name)] = value
+        return attrs
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NoteData):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"NoteData({self.asdict()!r})"
+
+
 class CMMEParser(BaseTransformer):
     """
     CMME format specific transformer.
@@ -96,6 +157,13 @@ class CMMEParser(BaseTransformer):
         'mordent': 'mord'
     }
     
+    # Optional note attributes carried over by the extended parser
+    OPTIONAL_NOTE_ATTRS = frozenset({'octave', 'accidental', 'stem-direction'})
+    
+    # Pitch format: standard ("C4", "D#3"), musica ficta ("C.4") or
+    # letter-only mensural pitch with no octave ("G", "Bb")
+    PITCH_PATTERN = re.compile(r'[A-G][#b.]?[0-9]?')
+    
     # Mensuration signs used in early music notation
     MENSURATION_SIGNS = {
         'C': 'tempus_imperfectum',         # Imperfect time (duple)
@@ -105,15 +173,27 @@ class CMMEParser(BaseTransformer):
         'C/': 'tempus_imperfectum_diminutum',        # Diminished imperfect time
         'O/': 'tempus_perfectum_diminutum'           # Diminished perfect time
     }
-
-    def __init__(self, schema_path: Optional[str] = None):
+    
+    # Shared parser: CMME uses no xml:id lookups or entities, and dropping
+    # whitespace-only text nodes keeps indented documents small
+    _PARSER = etree.XMLParser(
+        collect_ids=False,
+        resolve_entities=False,
+        remove_blank_text=True,
+        no_network=True
+    )
+
+    def __init__(self, schema_path: Optional[str] = None, compact_notes: bool = False):
         """
         Initialize CMME Parser.
 
         Args:
             schema_path (Optional[str]): Path to CMME XML schema file
+            compact_notes (bool): Return notes from parse_extended as NoteData
+                instances instead of dicts, to reduce memory on large scores
         """
         super().__init__(schema_path)
+        self.compact_notes = compact_notes
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.supported_elements = {
             'note', 'rest', 'chord', 'measure', 'staff', 'clef', 
@@ -124,6 +204,16 @@ class CMMEParser(BaseTransformer):
             'accidental', 'custos', 'directionSign', 'fermata',
             'editorial', 'critical', 'variant'
         }
+        # Handlers for the musical elements found inside a measure
+        self._measure_handlers = {
+            'note': self._emit_note,
+            'rest': self._emit_rest,
+            'chord': self._emit_chord
+        }
+        # Single-entry cache of the last child-free note parsed, as one
+        # (key, attributes) tuple so threads sharing the parser never see a
+        # key paired with another note's attributes
+        self._note_cache = (None, None)
 
     # Original core methods
     def parse(self, xml_string: str) -> List[etree._Element]:
@@ -140,7 +230,7 @@ class CMMEParser(BaseTransformer):
             ValueError: If parsing fails or no notes found
         """
         try:
-            root = etree.fromstring(xml_string)
+            root = etree.fromstring(xml_string, parser=self._PARSER)
             notes = root.findall('.//note')
             if not notes:
                 raise ValueError("No <note> elements found")
@@ -148,14 +238,38 @@ class CMMEParser(BaseTransformer):
         except etree.ParseError as e:
             raise ValueError(f"Parse error: {str(e)}")
 
-    def validate(self, xml_string: str) -> None:
-        """Validate CMME XML content."""
+    def validate(self, xml_string: Optional[str] = None,
+                 source: Optional[IO] = None) -> None:
+        """
+        Validate CMME XML content.
+
+        Content can be passed as a string or as a file-like ``source``. A
+        source is read and validated incrementally, so an invalid note is
+        reported as soon as it has been read, and notes are released once
+        they have been checked.
+
+        Args:
+            xml_string (Optional[str]): CMME XML content
+            source (Optional[IO]): File-like object to read CMME XML from
+
+        Raises:
+            ValueError: If validation fails, or neither xml_string nor
+                source is given
+        """
+        if xml_string is None and source is None:
+            raise ValueError("Either xml_string or source must be given")
+        
         try:
+            if source is not None:
+                if not self._check_notes(self._stream_notes(source)):
+                    raise ValueError("No <note> elements found")
+                return
+            
             # Remove any existing XML declaration
             if xml_string.startswith('<?xml'):
                 xml_string = xml_string[xml_string.find('?>')+2:].lstrip()
                 
-            root = etree.fromstring(xml_string.encode('utf-8'))
+            root = etree.fromstring(xml_string.encode('utf-8'), parser=self._PARSER)
             
             if root.tag != 'cmme':
                 raise ValueError("Root element must be <cmme>")
@@ -196,42 +310,119 @@ class CMMEParser(BaseTransformer):
         Raises:
             ValueError: If note validation fails
         """
-        notes = root.findall('.//note')
-        if not notes:
+        # Iterate lazily rather than materializing every note first; an
+        # empty count means the document has no notes at all
+        if not self._check_notes(root.iter('note')):
             raise ValueError("No <note> elements found")
+
+    def _check_notes(self, notes: Iterable[etree._Element]) -> int:
+        """
+        Validates each note of an iterable of note elements.
+
+        Args:
+            notes (Iterable[etree._Element]): Note elements to validate
+
+        Returns:
+            int: Number of notes validated
+
+        Raises:
+            ValueError: If note validation fails
+        """
+        # Bind loop invariants once; this loop runs for every note in the score
+        match_pitch = self.PITCH_PATTERN.fullmatch
+        valid_durations = self.VALID_DURATIONS_TEXT
+        mensuration_signs = self.MENSURATION_SIGNS
         
+        i = -1
         for i, note in enumerate(notes):
-            pitch = note.get('pitch')
-            duration = note.get('duration')
+            attrib = note.attrib
+            pitch = attrib.get('pitch')
+            duration = attrib.get('duration')
             
             if not pitch or not duration:
                 raise ValueError(f"Note {i}: Missing required attributes (pitch, duration)")
             
             # Validate pitch format with special handling for early music notation
-            # Standard format (e.g., "C4", "D#3") or Early music format (e.g., "C.4" for musica ficta)
-            if not (re.match(r'^[A-G][#b\.]?[0-9]$', pitch) or
-                    # Handle pitched mensural notation (letter-based pitch with no octave)
-                    re.match(r'^[A-G][#b\.]?$', pitch)):
+            if not match_pitch(pitch):
                 raise ValueError(f"Note {i}: Invalid pitch format: {pitch}")
             
             # Validate duration with expanded options for early music notation
-            if duration not in self.VALID_DURATIONS_TEXT:
+            if duration not in valid_durations:
                 raise ValueError(f"Note {i}: Invalid duration: {duration}")
             
+            # Most notes have no children, so skip the child lookups for them
+            if not len(note):
+                continue
+            
             # Check for ligature notation (specific to early music)
-            if note.find('ligature') is not None:
+            ligature = next(note.iterchildren('ligature'), None)
+            if ligature is not None:
                 # Validate ligature attributes
-                ligature = note.find('ligature')
                 position = ligature.get('position')
                 if position and position not in ('start', 'middle', 'end'):
                     raise ValueError(f"Note {i}: Invalid ligature position: {position}")
             
             # Check for mensuration (specific to early music)
-            if note.find('mensuration') is not None:
-                mensuration = note.find('mensuration')
+            mensuration = next(note.iterchildren('mensuration'), None)
+            if mensuration is not None:
                 sign = mensuration.get('sign')
-                if sign and sign not in self.MENSURATION_SIGNS:
+                if sign and sign not in mensuration_signs:
                     raise ValueError(f"Note {i}: Invalid mensuration sign: {sign}")
+        
+        return i + 1
+
+    def _stream_notes(self, source: IO, chunk_size: int = 4096) -> Iterator[etree._Element]:
+        """
+        Incrementally parse CMME XML from a file-like object, yielding notes.
+
+        The root element and metadata section are validated as they are
+        read. Each note is cleared after it has been yielded, and everything
+        before it is removed from the tree, so memory use does not grow with
+        the length of the score.
+
+        Args:
+            source (IO): File-like object to read CMME XML from
+            chunk_size (int): Number of bytes to read at a time
+
+        Yields:
+            etree._Element: Note elements in document order
+
+        Raises:
+            ValueError: If the root element or metadata is invalid
+        """
+        parser = etree.XMLPullParser(
+            events=('start', 'end'),
+            collect_ids=False,
+            resolve_entities=False,
+            no_network=True
+        )
+        root = None
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if root is None:
+                    root = elem
+                    if root.tag != 'cmme':
+                        raise ValueError("Root element must be <cmme>")
+                elif event == 'end':
+                    if elem.tag == 'note':
+                        # Drop the finished siblings before the note and
+                        # before each enclosing measure, staff etc.; earlier
+                        # notes have all been checked
+                        node = elem
+                        while node is not root:
+                            parent = node.getparent()
+                            while node.getprevious() is not None:
+                                del parent[0]
+                            node = parent
+                        yield elem
+                        elem.clear()
+                    elif elem.tag == 'metadata' and elem.getparent() is root:
+                        self._validate_metadata(root)
+        parser.close()
 
     def extract_metadata(self, root: etree._Element) -> Dict:
         """
@@ -243,12 +434,14 @@ class CMMEParser(BaseTransformer):
         Returns:
             Dict: Extracted metadata
         """
-        metadata = {}
         metadata_elem = root.find('metadata')
-        if metadata_elem is not None:
-            for elem in metadata_elem:
-                metadata[elem.tag] = elem.text
-        return metadata
+        if metadata_elem is None:
+            return {}
+        # Field names repeat across every score in a batch, so intern them
+        return {
+            sys.intern(elem.tag): elem.text
+            for elem in metadata_elem.iterchildren(etree.Element)
+        }
 
     def create_note(self, pitch: str, duration: str) -> etree._Element:
         """
@@ -265,7 +458,7 @@ class CMMEParser(BaseTransformer):
             ValueError: If pitch or duration is invalid
         """
         # Validate pitch with support for early music notation
-        if not (re.match(r'^[A-G][#b\.]?[0-9]$', pitch) or re.match(r'^[A-G][#b\.]?$', pitch)):
+        if not self.PITCH_PATTERN.fullmatch(pitch):
             raise ValueError(f"Invalid pitch format: {pitch}")
             
         if duration not in self.VALID_DURATIONS_TEXT:
@@ -333,7 +526,7 @@ class CMMEParser(BaseTransformer):
             ValueError: If parsing fails
         """
         try:
-            root = etree.fromstring(xml_string)
+            root = etree.fromstring(xml_string, parser=self._PARSER)
             return {
                 'metadata': self.extract_metadata(root),
                 'parts': self._parse_parts(root),
@@ -353,15 +546,23 @@ class CMMEParser(BaseTransformer):
         Returns:
             List[Dict[str, Any]]: List of parsed parts
         """
-        parts = []
-        for staff in root.findall('.//staff'):
-            part_data = {
-                'id': staff.get('id', ''),
-                'name': staff.get('name', ''),
-                'measures': self._parse_measures(staff)
-            }
-            parts.append(part_data)
-        return parts
+        return [self._parse_staff(staff) for staff in root.findall('.//staff')]
+
+    def _parse_staff(self, staff: etree._Element) -> Dict[str, Any]:
+        """
+        Parse a single part/staff.
+
+        Args:
+            staff (etree._Element): Staff element
+
+        Returns:
+            Dict[str, Any]: Parsed part
+        """
+        return {
+            'id': staff.get('id', ''),
+            'name': staff.get('name', ''),
+            'measures': self._parse_measures(staff)
+        }
 
     def _parse_measures(self, staff: etree._Element) -> List[Dict[str, Any]]:
         """
@@ -393,25 +594,50 @@ class CMMEParser(BaseTransformer):
             List[Dict[str, Any]]: List of parsed musical elements
         """
         contents = []
+        handlers = self._measure_handlers
         for elem in measure:
-            if elem.tag == 'note':
-                contents.append({
-                    'type': 'note',
-                    'attributes': self._parse_note_attributes(elem)
-                })
-            elif elem.tag == 'rest':
-                contents.append({
-                    'type': 'rest',
-                    'duration': elem.get('duration')
-                })
-            elif elem.tag == 'chord':
-                contents.append({
-                    'type': 'chord',
-                    'notes': [self._parse_note_attributes(note) 
-                             for note in elem.findall('note')]
-                })
+            handler = handlers.get(elem.tag)
+            if handler is not None:
+                contents.append(handler(elem))
         return contents
 
+    def _emit_note(self, note: etree._Element) -> Dict[str, Any]:
+        """Build the measure content entry for a note."""
+        return {
+            'type': 'note',
+            'attributes': self._parse_note(note)
+        }
+
+    def _emit_rest(self, rest: etree._Element) -> Dict[str, Any]:
+        """Build the measure content entry for a rest."""
+        return {
+            'type': 'rest',
+            'duration': rest.get('duration')
+        }
+
+    def _emit_chord(self, chord: etree._Element) -> Dict[str, Any]:
+        """Build the measure content entry for a chord."""
+        return {
+            'type': 'chord',
+            'notes': [self._parse_note(note)
+                      for note in chord.iterchildren('note')]
+        }
+
+    def _parse_note(self, note: etree._Element) -> Union[Dict[str, Any], NoteData]:
+        """
+        Parse a note in the representation selected by ``compact_notes``.
+
+        Args:
+            note (etree._Element): Note element
+
+        Returns:
+            Union[Dict[str, Any], NoteData]: Parsed note
+        """
+        attrs = self._parse_note_attributes(note)
+        if self.compact_notes:
+            return NoteData.from_attributes(attrs)
+        return attrs
+
     def _parse_note_attributes(self, note: etree._Element) -> Dict[str, Any]:
         """
         Parse attributes of a note element with support for early music notation features.
@@ -422,19 +648,28 @@ class CMMEParser(BaseTransformer):
         Returns:
             Dict[str, Any]: Parsed note attributes
         """
+        # A note without children is fully described by its attributes, and
+        # runs of identical notes are common, so reuse the previous result
+        attrib = note.attrib
+        items = attrib.items()
+        cache_key = None
+        if len(note) == 0:
+            cache_key = tuple(items)
+            cached_key, cached_value = self._note_cache
+            if cache_key == cached_key:
+                return cached_value.copy()
+        
         attrs = {
-            'pitch': note.get('pitch'),
-            'duration': note.get('duration')
+            'pitch': attrib.get('pitch'),
+            'duration': attrib.get('duration')
         }
         
-        # Optional attributes
-        optional_attrs = ['octave', 'accidental', 'stem-direction']
-        for attr in optional_attrs:
-            if attr in note.attrib:
-                attrs[attr] = note.get(attr)
+        # Optional attributes, picked from a single read of the attribute list
+        optional_attrs = self.OPTIONAL_NOTE_ATTRS
+        attrs.update((k, v) for k, v in items if k in optional_attrs)
         
         # Articulations
-        articulations = note.findall('articulation')
+        articulations = list(note.iterchildren('articulation'))
         if articulations:
             attrs['articulations'] = [
                 art.get('type') for art in articulations
@@ -443,7 +678,7 @@ class CMMEParser(BaseTransformer):
         # Early music specific features
         
         # Ligatures (connecting multiple notes in early music)
-        ligature = note.find('ligature')
+        ligature = next(note.iterchildren('ligature'), None)
         if ligature is not None:
             attrs['ligature'] = {
                 'position': ligature.get('position', 'middle'),
@@ -451,7 +686,7 @@ class CMMEParser(BaseTransformer):
             }
         
         # Mensuration signs (time signatures in early music)
-        mensuration = note.find('mensuration')
+        mensuration = next(note.iterchildren('mensuration'), None)
         if mensuration is not None:
             sign = mensuration.get('sign')
             attrs['mensuration'] = {
@@ -460,22 +695,26 @@ class CMMEParser(BaseTransformer):
             }
         
         # Coloration (note coloring indicating rhythmic alterations)
-        coloration = note.find('coloration')
+        coloration = next(note.iterchildren('coloration'), None)
         if coloration is not None:
             attrs['coloration'] = coloration.get('type', 'blackened')
         
         # Musica ficta (accidentals above the staff)
-        if 'ficta' in note.attrib or note.find('ficta') is not None:
-            attrs['ficta'] = note.get('ficta') or note.find('ficta').get('type')
+        ficta = next(note.iterchildren('ficta'), None)
+        if 'ficta' in attrib or ficta is not None:
+            attrs['ficta'] = attrib.get('ficta') or ficta.get('type')
         
         # Editorial markings (scholarly additions)
-        editorial = note.find('editorial')
+        editorial = next(note.iterchildren('editorial'), None)
         if editorial is not None:
             attrs['editorial'] = {
                 'type': editorial.get('type', 'addition'),
                 'source': editorial.get('source'),
                 'certainty': editorial.get('certainty')
             }
+        
+        if cache_key is not None:
+            self._note_cache = (cache_key, attrs.copy())
             
         return attrs
 
@@ -496,4 +735,4 @@ class CMMEParser(BaseTransformer):
                 'text': directive.text or '',
                 'placement': directive.get('placement', '')
             })
-        return directives
\ No newline at end of file
+        return directives
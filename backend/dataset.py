@@ -6,13 +6,217 @@ including creation, updating, and validation of datasets.
 """
 
 import os
+import re
 import json
 import shutil
-from typing import Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
 import logging
 from datetime import datetime
 from pathlib import Path
 from lxml import etree
+from .base import BaseTransformer
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fastest available JSON parser; both raise a ValueError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# JSON Schema for the notes/metadata structure of JSON dataset files
+_NOTES_SCHEMA = {
+    "type": "object",
+    "required": ["notes"],
+    "properties": {
+        "notes": {
+            "type": "array",
+            "items": {"type": "object", "required": ["pitch", "duration"]}
+        },
+        "metadata": {"type": "object"}
+    }
+}
+
+# Characters allowed in each position of a CMME pitch (letter, accidental, octave)
+_LETTERS = frozenset('ABCDEFG')
+_ACCIDENTALS = frozenset('#b')
+_DIGITS = frozenset('0123456789')
+
+# Allowed MEI pitch names (lowercase, as in MEI's data.PITCHNAME) and durations
+_MEI_PNAMES = frozenset('abcdefg')
+_MEI_DURATIONS = frozenset({'1', '2', '4', '8', '16', '32', '64', 'breve', 'long'})
+
+# Message templates for per-note validation errors, by error code
+_NOTE_ERROR_MESSAGES = {
+    'missing_attr': "Missing required attribute '{}'",
+    'invalid_pname': "Invalid pitch name '{}'",
+    'invalid_dur': "Invalid duration '{}'",
+    'invalid_pitch': "Invalid pitch format '{}'"
+}
+
+# Formats accepted for dataset files
+_ALLOWED_FORMATS = frozenset({'cmme', 'mei', 'json'})
+
+# Root tag of an XML document, after an optional BOM and XML declaration
+_XML_ROOT_RE = re.compile(rb'(?:\xef\xbb\xbf)?\s*(?:<\?xml[^?]*\?>\s*)?<([A-Za-z_][\w.:-]*)')
+_SNIFF_BYTES = 512
+
+# Compiled JSON Schema validators, keyed by schema identity
+_JSON_VALIDATORS: Dict[int, Callable] = {}
+
+
+class _WellFormedTarget:
+    """Parser target that discards all events, so parsing builds no tree."""
+
+    def close(self) -> None:
+        return None
+
+
+# Parser settings for notation files: no text-node size ceiling, no ID table,
+# no entity expansion
+_XML_PARSER_OPTIONS = dict(huge_tree=True, collect_ids=False,
+                           resolve_entities=False, remove_blank_text=True)
+
+# Shared parser for notation files
+_XML_PARSER = etree.XMLParser(**_XML_PARSER_OPTIONS)
+
+# Per-thread parsers for the validation pool; a parser runs one parse at a
+# time, so threads sharing _XML_PARSER would not overlap
+_THREAD_PARSERS = threading.local()
+
+# Locks serializing validate() and the error_log read on each shared schema
+_SCHEMA_LOCKS: Dict[int, threading.Lock] = {}
+
+# Checks XML well-formedness without allocating elements
+_WELL_FORMED_PARSER = etree.XMLParser(target=_WellFormedTarget(), huge_tree=True,
+                                      collect_ids=False, resolve_entities=False)
+
+
+def _sniff_xml_root(head: bytes) -> Optional[str]:
+    """
+    Read the local name of the root element from the start of an XML document.
+
+    Args:
+        head (bytes): First bytes of the document
+
+    Returns:
+        Optional[str]: Root local name, or None if it cannot be determined
+            (e.g. a comment or DOCTYPE precedes the root element)
+    """
+    match = _XML_ROOT_RE.match(head)
+    if match is None:
+        return None
+    return match.group(1).decode('ascii').rpartition(':')[2]
+
+
+class _DatasetPaths(NamedTuple):
+    """Precomputed string paths of a dataset directory."""
+    root: str
+    cmme: str
+    mei: str
+    json: str
+
+
+class _CachedMetadata(NamedTuple):
+    """Raw metadata file contents with the file state they were read at."""
+    mtime_ns: int
+    size: int
+    data: bytes
+
+
+# Metadata files keyed by path, least recently used first. An entry is used
+# only while the file's modification time and size still match it.
+_METADATA_CACHE: 'OrderedDict[str, _CachedMetadata]' = OrderedDict()
+_METADATA_CACHE_SIZE = 256
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _read_metadata_bytes(path: str) -> bytes:
+    """
+    Read a metadata file, reusing the cached contents while the file is unchanged.
+
+    Raw bytes are cached rather than the parsed dict so that every caller
+    gets its own freshly parsed, freely mutable copy.
+
+    Args:
+        path (str): Path to metadata.json
+
+    Returns:
+        bytes: File contents
+    """
+    stat = os.stat(path)
+    with _METADATA_CACHE_LOCK:
+        entry = _METADATA_CACHE.get(path)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            _METADATA_CACHE.move_to_end(path)
+            return entry.data
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[path] = _CachedMetadata(stat.st_mtime_ns, stat.st_size, data)
+        _METADATA_CACHE.move_to_end(path)
+        if len(_METADATA_CACHE) > _METADATA_CACHE_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+    return data
+
+
+def _thread_xml_parser() -> etree.XMLParser:
+    """
+    Return the notation file parser owned by the current thread.
+
+    Returns:
+        etree.XMLParser: Parser with the shared notation file settings
+    """
+    parser = getattr(_THREAD_PARSERS, 'parser', None)
+    if parser is None:
+        parser = _THREAD_PARSERS.parser = etree.XMLParser(**_XML_PARSER_OPTIONS)
+    return parser
+
+
+def _schema_lock(schema: etree._Validator) -> threading.Lock:
+    """
+    Return the lock guarding a compiled schema.
+
+    Compiled schemas are cached for the life of the process, so their ids
+    are stable keys.
+
+    Args:
+        schema (etree._Validator): Compiled XSD or RelaxNG schema
+
+    Returns:
+        threading.Lock: Lock to hold while validating and reading error_log
+    """
+    lock = _SCHEMA_LOCKS.get(id(schema))
+    if lock is None:
+        lock = _SCHEMA_LOCKS.setdefault(id(schema), threading.Lock())
+    return lock
+
+
+def _get_json_validator(schema: Dict) -> Callable:
+    """
+    Return a compiled validator for a JSON Schema, compiling it on first use.
+
+    Args:
+        schema (Dict): JSON Schema literal
+
+    Returns:
+        Callable: Validator raising JsonSchemaException on invalid data
+    """
+    validator = _JSON_VALIDATORS.get(id(schema))
+    if validator is None:
+        validator = fastjsonschema.compile(schema)
+        _JSON_VALIDATORS[id(schema)] = validator
+    return validator
 
 class Dataset:
     """
@@ -25,17 +229,48 @@ class Dataset:
         base_path (Path): Base path for dataset storage
         logger (logging.Logger): Logger instance
     """
+
+    # Datasets with more files than this are validated on a thread pool
+    PARALLEL_MIN_FILES = 8
+
+    # Datasets with fewer entries than this are deleted without shutil.rmtree
+    FAST_DELETE_MAX_ENTRIES = 16
+
+    # Compiled XPath queries; MEI ones match on local name so namespaced documents work
+    _XP_NOTE = etree.XPath('.//note')
+    _XP_MEI_NOTE = etree.XPath('.//*[local-name()="note"]')
+    _MEI_REQUIRED_SECTIONS = ('music', 'body', 'mdiv', 'score')
+    # First occurrence of each required section, in one query
+    _XP_MEI_SECTIONS = etree.XPath(' | '.join(
+        f'(.//*[local-name()="{section}"])[1]' for section in _MEI_REQUIRED_SECTIONS
+    ))
     
-    def __init__(self, base_path: Union[str, Path]):
+    def __init__(self, base_path: Union[str, Path],
+                 mei_schema: Optional[str] = None,
+                 cmme_schema: Optional[str] = None):
         """
         Initialize Dataset manager.
 
         Args:
             base_path (Union[str, Path]): Base path for dataset storage
+            mei_schema (Optional[str]): Path to an MEI XSD or RelaxNG schema
+            cmme_schema (Optional[str]): Path to a CMME XSD or RelaxNG schema
         """
         self.base_path = Path(base_path)
+        self._base_dir = str(self.base_path)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
+        # Schemas are compiled once; without one the rule-based checks are used
+        self._mei_schema = BaseTransformer._load_schema(mei_schema) if mei_schema else None
+        self._cmme_schema = BaseTransformer._load_schema(cmme_schema) if cmme_schema else None
+        
+        # Content checks used by _validate_file_format, by format
+        self._format_validators = {
+            'json': self._is_valid_json,
+            'mei': self._is_valid_mei,
+            'cmme': self._is_valid_cmme
+        }
+        
         # Create base directory if it doesn't exist
         self.base_path.mkdir(parents=True, exist_ok=True)
         
@@ -43,12 +278,14 @@ class Dataset:
         for format_dir in ['cmme', 'mei', 'json']:
             (self.base_path / format_dir).mkdir(exist_ok=True)
 
-    def validate_mei_content(self, root: etree._Element) -> Dict[str, any]:
+    def validate_mei_content(self, root: etree._Element, format_errors: bool = True) -> Dict[str, any]:
         """
         Validate MEI-specific content rules.
 
         Args:
             root (etree._Element): Root element of MEI document
+            format_errors (bool): Whether to build messages for note errors;
+                pass False when only the "valid" flag is needed
 
         Returns:
             Dict[str, Any]: Validation results
@@ -64,34 +301,25 @@ class Dataset:
             if not root.nsmap.get(None) == 'http://www.music-encoding.org/ns/mei':
                 results["warnings"].append("Missing or incorrect MEI namespace")
 
+            if self._mei_schema is not None:
+                self._validate_with_schema(self._mei_schema, root, results)
+                return results
+
             # Validate required sections
-            required_sections = ['music', 'body', 'mdiv', 'score']
-            for section in required_sections:
-                if not root.find(f'.//{section}'):
+            found_sections = {etree.QName(elem).localname for elem in self._XP_MEI_SECTIONS(root)}
+            for section in self._MEI_REQUIRED_SECTIONS:
+                if section not in found_sections:
                     results["errors"].append(f"Missing required section: {section}")
                     results["valid"] = False
 
-            # Validate notes
-            notes = root.findall('.//note')
-            for i, note in enumerate(notes):
-                # Check required attributes
-                required_attrs = ['pname', 'dur']
-                for attr in required_attrs:
-                    if attr not in note.attrib:
-                        results["errors"].append(f"Note {i+1}: Missing required attribute '{attr}'")
-                        results["valid"] = False
-
-                # Validate pitch name
-                pname = note.get('pname')
-                if pname and not pname in 'A B C D E F G':
-                    results["errors"].append(f"Note {i+1}: Invalid pitch name '{pname}'")
-                    results["valid"] = False
-
-                # Validate duration
-                dur = note.get('dur')
-                if dur and not dur in ['1', '2', '4', '8', '16', '32', '64', 'breve', 'long']:
-                    results["errors"].append(f"Note {i+1}: Invalid duration '{dur}'")
-                    results["valid"] = False
+            # Validate notes in one pass; notes with an allowed pitch name and
+            # duration cannot fail any check, so only the others are examined
+            note_errors = []
+            for note_index, note in enumerate(self._XP_MEI_NOTE(root), 1):
+                if note.get('pname') in _MEI_PNAMES and note.get('dur') in _MEI_DURATIONS:
+                    continue
+                self._check_mei_note(note, note_index, note_errors)
+            self._add_note_errors(note_errors, results, format_errors)
 
             return results
 
@@ -100,12 +328,14 @@ class Dataset:
             results["errors"].append(f"Validation error: {str(e)}")
             return results
 
-    def validate_cmme_content(self, root: etree._Element) -> Dict[str, any]:
+    def validate_cmme_content(self, root: etree._Element, format_errors: bool = True) -> Dict[str, any]:
         """
         Validate CMME-specific content rules.
 
         Args:
             root (etree._Element): Root element of CMME document
+            format_errors (bool): Whether to build messages for note errors;
+                pass False when only the "valid" flag is needed
 
         Returns:
             Dict[str, Any]: Validation results
@@ -117,11 +347,6 @@ class Dataset:
         }
 
         try:
-            # Check root element
-            if root.tag != 'cmme':
-                results["errors"].append("Root element must be <cmme>")
-                results["valid"] = False
-
             # Validate metadata
             metadata = root.find('metadata')
             if metadata is None:
@@ -132,21 +357,28 @@ class Dataset:
                     if metadata.find(field) is None:
                         results["warnings"].append(f"Missing metadata field: {field}")
 
-            # Validate notes
-            notes = root.findall('.//note')
-            for i, note in enumerate(notes):
-                # Check required attributes
-                required_attrs = ['pitch', 'duration']
-                for attr in required_attrs:
-                    if attr not in note.attrib:
-                        results["errors"].append(f"Note {i+1}: Missing required attribute '{attr}'")
-                        results["valid"] = False
+            if self._cmme_schema is not None:
+                self._validate_with_schema(self._cmme_schema, root, results)
+                return results
 
-                # Validate pitch format
+            # Check root element
+            if root.tag != 'cmme':
+                results["errors"].append("Root element must be <cmme>")
+                results["valid"] = False
+
+            # Validate notes in one pass; scores repeat a small set of pitches,
+            # so each pitch is fully checked only until a note with it passes
+            note_errors = []
+            valid_pitches = set()
+            for note_index, note in enumerate(self._XP_NOTE(root), 1):
                 pitch = note.get('pitch')
-                if pitch and not self._is_valid_cmme_pitch(pitch):
-                    results["errors"].append(f"Note {i+1}: Invalid pitch format '{pitch}'")
-                    results["valid"] = False
+                if pitch in valid_pitches and note.get('duration') is not None:
+                    continue
+                error_count = len(note_errors)
+                self._check_cmme_note(note, note_index, note_errors)
+                if len(note_errors) == error_count:
+                    valid_pitches.add(pitch)
+            self._add_note_errors(note_errors, results, format_errors)
 
             return results
 
@@ -155,6 +387,94 @@ class Dataset:
             results["errors"].append(f"Validation error: {str(e)}")
             return results
 
+    def _check_mei_note(self, note: etree._Element, note_index: int,
+                        note_errors: List[tuple]) -> None:
+        """
+        Check a single MEI note against the content rules.
+
+        Args:
+            note (etree._Element): MEI note element
+            note_index (int): 1-based position of the note in the document
+            note_errors (List[tuple]): (note_index, code, value) entries to extend
+        """
+        # Check required attributes; notes in a chord take its duration
+        required_attrs = ['pname', 'dur']
+        parent = note.getparent()
+        if parent is not None and etree.QName(parent).localname == 'chord':
+            required_attrs = ['pname']
+        for attr in required_attrs:
+            if attr not in note.attrib:
+                note_errors.append((note_index, 'missing_attr', attr))
+
+        # Validate pitch name
+        pname = note.get('pname')
+        if pname and pname not in _MEI_PNAMES:
+            note_errors.append((note_index, 'invalid_pname', pname))
+
+        # Validate duration
+        dur = note.get('dur')
+        if dur and dur not in _MEI_DURATIONS:
+            note_errors.append((note_index, 'invalid_dur', dur))
+
+    def _check_cmme_note(self, note: etree._Element, note_index: int,
+                         note_errors: List[tuple]) -> None:
+        """
+        Check a single CMME note against the content rules.
+
+        Args:
+            note (etree._Element): CMME note element
+            note_index (int): 1-based position of the note in the document
+            note_errors (List[tuple]): (note_index, code, value) entries to extend
+        """
+        # Check required attributes
+        required_attrs = ['pitch', 'duration']
+        for attr in required_attrs:
+            if attr not in note.attrib:
+                note_errors.append((note_index, 'missing_attr', attr))
+
+        # Validate pitch format
+        pitch = note.get('pitch')
+        if pitch and not self._is_valid_cmme_pitch(pitch):
+            note_errors.append((note_index, 'invalid_pitch', pitch))
+
+    def _add_note_errors(self, note_errors: List[tuple], results: Dict[str, any],
+                         format_errors: bool) -> None:
+        """
+        Record collected note errors in the validation results.
+
+        Args:
+            note_errors (List[tuple]): (note_index, code, value) entries
+            results (Dict[str, Any]): Validation results to update
+            format_errors (bool): Whether to turn the entries into messages
+        """
+        if not note_errors:
+            return
+        results["valid"] = False
+        if format_errors:
+            results["errors"].extend(
+                f"Note {note_index}: " + _NOTE_ERROR_MESSAGES[code].format(value)
+                for note_index, code, value in note_errors
+            )
+
+    def _validate_with_schema(self, schema: etree._Validator, root: etree._Element,
+                              results: Dict[str, any]) -> None:
+        """
+        Validate a document against a compiled schema.
+
+        Args:
+            schema (etree._Validator): Compiled XSD or RelaxNG schema
+            root (etree._Element): Root element to validate
+            results (Dict[str, Any]): Validation results to update
+        """
+        # The error log belongs to the schema, so another thread validating
+        # with it in between would replace this document's errors
+        with _schema_lock(schema):
+            if schema.validate(root):
+                return
+            errors = [f"Line {error.line}: {error.message}" for error in schema.error_log]
+        results["valid"] = False
+        results["errors"].extend(errors)
+
     def validate_json_content(self, data: Dict) -> Dict[str, any]:
         """
         Validate JSON content structure.
@@ -172,6 +492,16 @@ class Dataset:
         }
 
         try:
+            # The compiled validator only confirms valid documents quickly;
+            # invalid ones go through the checks below so every error is
+            # reported, in the same form with or without fastjsonschema
+            if fastjsonschema is not None:
+                try:
+                    _get_json_validator(_NOTES_SCHEMA)(data)
+                    return results
+                except fastjsonschema.JsonSchemaException:
+                    pass
+
             # Check basic structure
             if not isinstance(data, dict):
                 results["errors"].append("JSON root must be an object")
@@ -223,41 +553,71 @@ class Dataset:
         Returns:
             bool: True if valid, False otherwise
         """
-        import re
         # CMME pitch format: letter(A-G), optional accidental(#/b), octave number
-        return bool(re.match(r'^[A-G][#b]?[0-9]$', pitch))
-
-    def _validate_file_format(self, content: str, format_type: str) -> bool:
+        n = len(pitch)
+        if n == 2:
+            return pitch[0] in _LETTERS and pitch[1] in _DIGITS
+        if n == 3:
+            return pitch[0] in _LETTERS and pitch[1] in _ACCIDENTALS and pitch[2] in _DIGITS
+        return False
+
+    def _validate_file_format(self, content: Union[str, bytes], format_type: str) -> bool:
         """
         Validate file content matches expected format.
 
         Args:
-            content (str): File content
+            content (Union[str, bytes]): File content, bytes being UTF-8 encoded
             format_type (str): Expected format type
 
         Returns:
             bool: True if valid, False otherwise
         """
-        try:
-            if format_type == 'json':
-                json.loads(content)
-                return True
-            elif format_type in ['cmme', 'mei']:
-                # Remove any existing XML declaration
-                if content.startswith('<?xml'):
-                    content = content[content.find('?>')+2:].lstrip()
-                
-                root = etree.fromstring(content.encode('utf-8'))
-                
-                if format_type == 'mei':
-                    return root.tag == 'mei' or root.tag.endswith('}mei')
-                else:  # cmme
-                    return root.tag == 'cmme'
-                    
+        validator = self._format_validators.get(format_type)
+        if validator is None:
             return False
+        try:
+            return validator(content)
         except Exception:
             return False
 
+    def _is_valid_json(self, content: Union[str, bytes]) -> bool:
+        """Check that content parses as JSON."""
+        _json_loads(content)
+        return True
+
+    def _is_valid_mei(self, content: Union[str, bytes]) -> bool:
+        """Check that content is well-formed XML with an <mei> root."""
+        return self._is_valid_xml(content, 'mei')
+
+    def _is_valid_cmme(self, content: Union[str, bytes]) -> bool:
+        """Check that content is well-formed XML with a <cmme> root."""
+        return self._is_valid_xml(content, 'cmme')
+
+    def _is_valid_xml(self, content: Union[str, bytes], root_name: str) -> bool:
+        """
+        Check that content is well-formed XML with the expected root element.
+
+        Args:
+            content (Union[str, bytes]): File content, bytes being UTF-8 encoded
+            root_name (str): Expected local name of the root element
+
+        Returns:
+            bool: True if valid, False otherwise
+
+        Raises:
+            etree.XMLSyntaxError: If the content is not well-formed
+        """
+        data = content if isinstance(content, bytes) else content.encode('utf-8')
+        sniffed = _sniff_xml_root(data[:_SNIFF_BYTES])
+        if sniffed is None:
+            # Inconclusive sniff, parse the tree to find the root
+            return etree.QName(etree.fromstring(data, parser=_XML_PARSER)).localname == root_name
+        if sniffed != root_name:
+            return False
+        # Root matches, only well-formedness is left to check
+        etree.fromstring(data, parser=_WELL_FORMED_PARSER)
+        return True
+
     def create_dataset(self, name: str, description: str = "", files: List[Dict] = None, metadata: Optional[Dict] = None) -> Dict:
         """
         Create a new dataset with optional initial files and metadata.
@@ -271,20 +631,21 @@ class Dataset:
         Returns:
             Dict: Dataset metadata
         """
-        dataset_path = self.base_path / name
-        if dataset_path.exists():
+        paths = self._paths(name)
+        if os.path.exists(paths.root):
             raise ValueError(f"Dataset '{name}' already exists")
             
         # Create dataset directory and format subdirectories
-        dataset_path.mkdir(parents=True)
-        for format_type in ['cmme', 'mei', 'json']:
-            (dataset_path / format_type).mkdir(exist_ok=True)
+        os.makedirs(paths.root)
+        for format_dir in (paths.cmme, paths.mei, paths.json):
+            os.makedirs(format_dir, exist_ok=True)
         
+        now = datetime.now().isoformat()
         metadata_dict = {
             'name': name,
             'description': description,
-            'created': datetime.now().isoformat(),
-            'updated': datetime.now().isoformat(),
+            'created': now,
+            'updated': now,
             'file_count': 0,
             'formats': {
                 'cmme': 0,
@@ -300,46 +661,48 @@ class Dataset:
                     metadata_dict[key] = value
         
         # Save initial metadata
-        self._save_metadata(dataset_path, metadata_dict)
+        self._save_metadata(paths.root, metadata_dict)
         
         # Add initial files if provided
         if files:
             self.update_dataset(name, files)
-            metadata_dict = self._load_metadata(dataset_path)  # Reload updated metadata
+            metadata_dict = self._load_metadata(paths.root)  # Reload updated metadata
         
         return metadata_dict
 
     def update_dataset(self, name: str, files: List[Dict], description: Optional[str] = None) -> Dict:
         """Update existing dataset with new files."""
-        dataset_path = self.base_path / name
-        if not dataset_path.exists():
+        paths = self._paths(name)
+        if not os.path.exists(paths.root):
             raise ValueError(f"Dataset '{name}' does not exist")
             
-        metadata = self._load_metadata(dataset_path)
+        metadata = self._load_metadata(paths.root)
         
         if description is not None:
             metadata['description'] = description
+
+        for format_dir in (paths.cmme, paths.mei, paths.json):
+            os.makedirs(format_dir, exist_ok=True)
             
         for file_info in files:
             try:
                 format_type = file_info['format'].lower()
-                if format_type not in ['cmme', 'mei', 'json']:
+                if format_type not in _ALLOWED_FORMATS:
                     raise ValueError(f"Unsupported format: {format_type}")
                 
                 content = file_info['content']
                 filename = file_info['filename']
                 
+                # Encode once; the same bytes are validated and written
+                data = content if isinstance(content, bytes) else content.encode('utf-8')
+                
                 # Validate content format
-                if not self._validate_file_format(content, format_type):
+                if not self._validate_file_format(data, format_type):
                     raise ValueError(f"Invalid {format_type.upper()} format")
                 
                 # Save file
-                format_dir = dataset_path / format_type
-                format_dir.mkdir(exist_ok=True)
-                
-                file_path = format_dir / filename
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                with open(os.path.join(getattr(paths, format_type), filename), 'wb') as f:
+                    f.write(data)
                     
                 metadata['formats'][format_type] += 1
                 metadata['file_count'] += 1
@@ -349,15 +712,16 @@ class Dataset:
                 raise ValueError(f"Error processing file: {str(e)}")
         
         metadata['updated'] = datetime.now().isoformat()
-        self._save_metadata(dataset_path, metadata)
+        self._save_metadata(paths.root, metadata)
         return metadata
 
-    def get_dataset(self, name: str) -> Dict:
+    def get_dataset(self, name: str, include_files: bool = True) -> Dict:
         """
         Get dataset information.
 
         Args:
             name (str): Dataset name
+            include_files (bool): Whether to list the files of each format
 
         Returns:
             Dict: Dataset metadata and files
@@ -365,18 +729,21 @@ class Dataset:
         Raises:
             ValueError: If dataset doesn't exist
         """
-        dataset_path = self.base_path / name
-        if not dataset_path.exists():
+        paths = self._paths(name)
+        if not os.path.exists(paths.root):
             raise ValueError(f"Dataset '{name}' does not exist")
             
-        metadata = self._load_metadata(dataset_path)
+        metadata = self._load_metadata(paths.root)
+        if not include_files:
+            return metadata
         
         # Add file listings
         files = {}
         for format_type in ['cmme', 'mei', 'json']:
-            format_dir = dataset_path / format_type
-            if format_dir.exists():
-                files[format_type] = [f.name for f in format_dir.glob('*')]
+            format_dir = getattr(paths, format_type)
+            if os.path.exists(format_dir):
+                with os.scandir(format_dir) as entries:
+                    files[format_type] = [entry.name for entry in entries]
                 
         metadata['files'] = files
         return metadata
@@ -389,16 +756,35 @@ class Dataset:
             List[Dict]: List of dataset metadata
         """
         datasets = []
-        for path in self.base_path.glob('*'):
-            if path.is_dir():
-                try:
-                    metadata = self._load_metadata(path)
-                    datasets.append(metadata)
-                except Exception as e:
-                    self.logger.error(f"Error loading dataset {path.name}: {str(e)}")
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    try:
+                        metadata = self._load_metadata(entry.path)
+                        datasets.append(metadata)
+                    except Exception as e:
+                        self.logger.error(f"Error loading dataset {entry.name}: {str(e)}")
                     
         return datasets
 
+    def _paths(self, name: str) -> _DatasetPaths:
+        """
+        Build the string paths of a dataset once.
+
+        Args:
+            name (str): Dataset name
+
+        Returns:
+            _DatasetPaths: Dataset root and format directories
+        """
+        root = os.path.join(self._base_dir, name)
+        return _DatasetPaths(
+            root=root,
+            cmme=os.path.join(root, 'cmme'),
+            mei=os.path.join(root, 'mei'),
+            json=os.path.join(root, 'json')
+        )
+
     def delete_dataset(self, name: str) -> bool:
         """
         Delete a dataset.
@@ -412,12 +798,33 @@ class Dataset:
         Raises:
             ValueError: If dataset doesn't exist
         """
-        dataset_path = self.base_path / name
-        if not dataset_path.exists():
+        paths = self._paths(name)
+        if not os.path.exists(paths.root):
             raise ValueError(f"Dataset '{name}' does not exist")
             
         try:
-            shutil.rmtree(dataset_path)
+            # Walk bottom-up, stopping as soon as the dataset turns out not to be small
+            walked = []
+            entry_count = 0
+            for walk_entry in os.walk(paths.root, topdown=False):
+                walked.append(walk_entry)
+                entry_count += len(walk_entry[1]) + len(walk_entry[2])
+                if entry_count >= self.FAST_DELETE_MAX_ENTRIES:
+                    break
+
+            if entry_count < self.FAST_DELETE_MAX_ENTRIES:
+                for dir_path, dir_names, file_names in walked:
+                    for file_name in file_names:
+                        os.unlink(os.path.join(dir_path, file_name))
+                    for dir_name in dir_names:
+                        sub_path = os.path.join(dir_path, dir_name)
+                        if os.path.islink(sub_path):
+                            os.unlink(sub_path)
+                        else:
+                            os.rmdir(sub_path)
+                os.rmdir(paths.root)
+            else:
+                shutil.rmtree(paths.root)
             return True
         except Exception as e:
             self.logger.error(f"Error deleting dataset {name}: {str(e)}")
@@ -425,18 +832,24 @@ class Dataset:
 
     def _save_metadata(self, dataset_path: Union[str, Path], metadata: Dict) -> None:
         """Save dataset metadata."""
-        if isinstance(dataset_path, str):
-            dataset_path = Path(dataset_path)
-        with open(dataset_path / 'metadata.json', 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_file = os.path.join(dataset_path, 'metadata.json')
+        if orjson is not None:
+            with open(metadata_file, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(metadata_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2)
+        
+        # A rewrite within the file system's timestamp resolution can keep the
+        # same modification time and size, so drop only this file's entry
+        with _METADATA_CACHE_LOCK:
+            _METADATA_CACHE.pop(metadata_file, None)
 
     def _load_metadata(self, dataset_path: Union[str, Path]) -> Dict:
         """Load dataset metadata."""
         try:
-            if isinstance(dataset_path, str):
-                dataset_path = Path(dataset_path)
-            with open(dataset_path / 'metadata.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
+            metadata_file = os.path.join(dataset_path, 'metadata.json')
+            return _json_loads(_read_metadata_bytes(metadata_file))
         except Exception as e:
             raise ValueError(f"Error loading dataset metadata: {str(e)}")
 
@@ -453,8 +866,8 @@ class Dataset:
         Raises:
             ValueError: If dataset doesn't exist
         """
-        dataset_path = self.base_path / name
-        if not dataset_path.exists():
+        paths = self._paths(name)
+        if not os.path.exists(paths.root):
             raise ValueError(f"Dataset '{name}' does not exist")
             
         results = {
@@ -463,50 +876,62 @@ class Dataset:
             'errors': []
         }
         
+        tasks = []
         for format_type in ['cmme', 'mei', 'json']:
-            format_dir = dataset_path / format_type
-            if format_dir.exists():
-                for file_path in format_dir.glob('*'):
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                        # Validate based on format
-                        if format_type == 'json':
-                            json.loads(content)
-                        elif format_type in ['cmme', 'mei']:
-                            # Use existing validation logic
-                            pass
-                            
-                        results['valid'] += 1
-                    except Exception as e:
-                        results['invalid'] += 1
-                        results['errors'].append({
-                            'file': str(file_path),
-                            'error': str(e)
-                        })
+            format_dir = getattr(paths, format_type)
+            if os.path.exists(format_dir):
+                with os.scandir(format_dir) as entries:
+                    tasks.extend((format_type, entry.path) for entry in entries)
+
+        format_types = [format_type for format_type, _ in tasks]
+        file_paths = [file_path for _, file_path in tasks]
+        if len(tasks) > self.PARALLEL_MIN_FILES:
+            # File reads and C-level parsing release the GIL, so threads overlap
+            # them; each thread parses with its own parser
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                errors = list(executor.map(self._validate_one, format_types, file_paths))
+        else:
+            errors = list(map(self._validate_one, format_types, file_paths))
+
+        for file_path, error in zip(file_paths, errors):
+            if error is None:
+                results['valid'] += 1
+            else:
+                results['invalid'] += 1
+                results['errors'].append({
+                    'file': str(file_path),
+                    'error': error
+                })
                         
         return results
-    
-    def _validate_file_format(self, content: str, format_type: str) -> bool:
+
+    def _validate_one(self, format_type: str, file_path: str) -> Optional[str]:
         """
-        Validate file content matches expected format.
+        Validate a single dataset file.
 
         Args:
-            content (str): File content
-            format_type (str): Expected format type
+            format_type (str): Format of the file
+            file_path (str): Path to the file
 
         Returns:
-            bool: True if valid, False otherwise
+            Optional[str]: Error message, or None if the file is valid
         """
         try:
+            # Validate based on format
             if format_type == 'json':
-                json.loads(content)
-                return True
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    _json_loads(f.read())
             elif format_type in ['cmme', 'mei']:
-                # Basic XML validation
-                etree.fromstring(content.encode('utf-8'))
-                return True
-            return False
-        except Exception:
-            return False
+                # Parsed straight from the path, which checks well-formedness;
+                # the content is only checked against a configured schema
+                root = etree.parse(file_path, _thread_xml_parser()).getroot()
+                schema = self._mei_schema if format_type == 'mei' else self._cmme_schema
+                if schema is not None:
+                    schema_results = {"valid": True, "errors": []}
+                    self._validate_with_schema(schema, root, schema_results)
+                    if not schema_results["valid"]:
+                        return "; ".join(schema_results["errors"])
+                
+            return None
+        except Exception as e:
+            return str(e)
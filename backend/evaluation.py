@@ -5,17 +5,334 @@ This module provides tools for evaluating conversion quality, analyzing data los
 and generating detailed reports on conversion accuracy.
 """
 
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple, Any, Set
 from lxml import etree
 import json
-import difflib
 import logging
-from dataclasses import dataclass
-from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from collections import Counter, OrderedDict, defaultdict
+from itertools import count, islice
 import os
+import hashlib
+import threading
+import time
+import atexit
+from queue import Queue
+from io import BytesIO
 from datetime import datetime
+from types import MappingProxyType
+from bisect import bisect_left
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Fastest available JSON parser; both raise json.JSONDecodeError on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# MEI namespace and the prefix map used in XPath queries
+_MEI_NS = 'http://www.music-encoding.org/ns/mei'
+_MEI_NSMAP = {'mei': _MEI_NS}
+
+# XPath counts compiled once and shared by all evaluators; count() avoids
+# building a node list when only the number of matches is used
+_XP_ALL_COUNT = etree.XPath('count(//*)')
+_XP_LIGATURE_COUNT = etree.XPath('count(//ligature)')
+_XP_MENSURATION_COUNT = etree.XPath('count(//mensuration)')
+_XP_MEASURE_COUNT = etree.XPath('count(//measure|//mei:measure)', namespaces=_MEI_NSMAP)
+_XP_MEI_EDITORIAL_COUNT = etree.XPath('count(//mei:supplied|//mei:unclear|//mei:sic|//mei:corr)',
+                                      namespaces=_MEI_NSMAP)
+_XP_MEI_NEUME_COUNT = etree.XPath('count(//mei:neume)', namespaces=_MEI_NSMAP)
+_XP_NOTE_COUNT = etree.XPath('count(//note) + count(//rest) + count(//chord)')
+
+def _indel_similarity(a: str, b: str) -> float:
+    """
+    Similarity of two strings as 2 * LCS / (len(a) + len(b)).
+
+    Uses rapidfuzz when installed. Otherwise computes the same value with
+    the bit-parallel LCS algorithm on Python integers, which costs about
+    len(a) * len(b) / 64 word operations instead of a quadratic Python loop.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+
+    Returns:
+        float: Similarity between 0 and 1 (1 for two empty strings)
+    """
+    if Indel is not None:
+        return Indel.normalized_similarity(a, b)
+    if not a and not b:
+        return 1.0
+
+    # Bit i of a character's mask is set where that character occurs in a
+    masks = {}
+    for i, char in enumerate(a):
+        masks[char] = masks.get(char, 0) | (1 << i)
+
+    all_bits = (1 << len(a)) - 1
+    row = all_bits
+    for char in b:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & all_bits
+
+    # Cleared bits of the final row count the LCS length
+    lcs = len(a) - bin(row).count('1')
+    return 2 * lcs / (len(a) + len(b))
+
+
+# Parsers shared by all evaluators: one for comparing documents and one that
+# drops formatting for normalization. Scoring never looks up elements by
+# xml:id and only compares stripped text, so the comparison parser skips the
+# ID table and indentation-only text nodes, which keeps large scores smaller
+# and faster to walk. Entities are left unresolved.
+_XML_PARSER = etree.XMLParser(
+    remove_blank_text=True, collect_ids=False, huge_tree=True, resolve_entities=False
+)
+_NORMALIZE_PARSER = etree.XMLParser(remove_blank_text=True, remove_comments=True)
+
+# iterparse takes parser options rather than a parser; the streaming validators
+# use the comparison parser's settings
+_ITERPARSE_OPTIONS = MappingProxyType({
+    'remove_blank_text': True, 'collect_ids': False, 'huge_tree': True, 'resolve_entities': False
+})
+
+# Default ns0 prefix written by some serializers, and its MEI replacement
+_NS0_RE = re.compile(r'xmlns:ns0=|ns0:')
+_NS0_REPL = {'ns0:': 'mei:', 'xmlns:ns0=': 'xmlns:mei='}
+
+# MEI elements read by the metadata extractor, in Clark notation
+_MEI_TITLE = f'{{{_MEI_NS}}}title'
+_MEI_COMPOSER = f'{{{_MEI_NS}}}composer'
+_MEI_FILEDESC = f'{{{_MEI_NS}}}fileDesc'
+
+# Musical elements counted for structural integrity, as compiled count()
+# expressions per format. libxml2 counts the matches without creating a Python
+# object per element, which dominates on scores with many thousands of notes.
+_STRUCTURE_ELEMENTS = ('note', 'rest', 'chord', 'measure')
+_STRUCTURE_COUNTS = MappingProxyType({
+    'cmme': tuple(etree.XPath(f'count(//{tag})') for tag in _STRUCTURE_ELEMENTS),
+    'mei': tuple(etree.XPath(f'count(//mei:{tag})', namespaces=_MEI_NSMAP)
+                 for tag in _STRUCTURE_ELEMENTS),
+})
+
+# Attributes compared between corresponding source and target elements
+_IMPORTANT_ATTRIBUTES = frozenset(('pitch', 'duration', 'pname', 'oct', 'dur', 'accidental', 'accid'))
+
+# Lost elements and attributes that weigh on data loss severity
+_MUSICAL_LOSS_ELEMENTS = frozenset(('note', 'notes', 'rest', 'rests', 'chord', 'chords'))
+_IMPORTANT_LOSS_ATTRIBUTES = frozenset(('pitch', 'duration', 'pname', 'oct', 'dur'))
+
+# Severity levels in increasing order. Each band lists the values a count must
+# exceed to move up one level, so bisect_left over a band gives the level
+# that count reaches on its own.
+_SEVERITY_LEVELS = ('none', 'low', 'medium', 'high')
+_CROSS_FORMAT_CONVERSIONS = frozenset(('cmme_to_mei', 'mei_to_cmme', 'cmme_to_json', 'mei_to_json'))
+_CROSS_FORMAT_MUSICAL_BANDS = (0, 5, 10)
+_CROSS_FORMAT_ATTRIBUTE_BANDS = (3, 10)
+_MUSICAL_BANDS = (0, 0, 5)
+_IMPORTANT_ATTRIBUTE_BANDS = (0, 2, 5)
+# Structural-only loss starts at "low", one level above these bands
+_STRUCTURAL_ELEMENT_BANDS = (5, 10)
+_STRUCTURAL_ATTRIBUTE_BANDS = (10, 20)
+
+# Lost elements and attributes that trigger content review recommendations
+_REVIEW_ELEMENTS = frozenset(('note', 'rest', 'chord'))
+_REVIEW_ATTRIBUTES = frozenset(('pitch', 'pname', 'duration', 'dur'))
+
+# Source duration names and pitch accidentals with their MEI attribute values
+_DURATION_MAP = MappingProxyType({
+    'whole': '1', 'half': '2', 'quarter': '4',
+    'eighth': '8', 'sixteenth': '16', '32nd': '32',
+    'maxima': 'maxima', 'longa': 'long', 'brevis': 'breve'
+})
+_ACCID_MAP = MappingProxyType({'#': 's', 'b': 'f'})
+
+# Source pitch such as "C4" or "F#5", split into step, accidental and octave
+_PITCH_RE = re.compile(r'^([A-G])([#b])?(\d+)$')
+
+# Elements an MEI result must contain
+_MEI_REQUIRED_ELEMENTS = ('music', 'body', 'mdiv', 'score')
+
+# Normalized XML keyed by a digest of the input, least recently used first
+_NORMALIZED_CACHE: 'OrderedDict[bytes, str]' = OrderedDict()
+_NORMALIZED_CACHE_SIZE = 128
+_NORMALIZED_CACHE_LOCK = threading.Lock()
+
+
+class _CachedDocument(NamedTuple):
+    """Parsed document with the metadata extracted from it, by format."""
+    root: etree._Element
+    metadata: Dict[str, Mapping[str, Any]]
+    size: int
+
+
+# Parsed documents keyed by a digest of their content, least recently used first.
+# _DOCUMENT_KEYS maps id(root) back to the cache key so metadata can be stored
+# with its tree; an entry holds its root, so the id is not reused while cached.
+# Besides the entry count, the encoded size of the cached documents is capped,
+# since a tree takes several times the memory of its text; the newest document
+# is always kept so a single evaluate+analyze cycle can reuse it.
+_DOCUMENT_CACHE: 'OrderedDict[bytes, _CachedDocument]' = OrderedDict()
+_DOCUMENT_KEYS: Dict[int, bytes] = {}
+_DOCUMENT_CACHE_SIZE = 32
+_DOCUMENT_CACHE_BYTES = 32 * 1024 * 1024
+_DOCUMENT_CACHE_LOCK = threading.Lock()
+
+# Parsed JSON documents keyed by a digest of their content, least recently used first
+_JSON_CACHE: 'OrderedDict[bytes, Any]' = OrderedDict()
+_JSON_CACHE_SIZE = 32
+_JSON_CACHE_LOCK = threading.Lock()
+
+
+class _SourceAnalysis(NamedTuple):
+    """Parsed source document and its element tally."""
+    root: etree._Element
+    total_elements: int
+    weighted_total: int
+    tag_counts: Counter
+
+
+# Source element tallies keyed by a digest of the normalized source, least recently
+# used first; the trees themselves are held only by the document cache
+_SOURCE_CACHE: 'OrderedDict[bytes, Tuple[int, int, Counter]]' = OrderedDict()
+_SOURCE_CACHE_SIZE = 32
+_SOURCE_CACHE_LOCK = threading.Lock()
+
+# Element mappings between different formats
+_ELEMENT_MAPPINGS = MappingProxyType({
+    'cmme_to_mei': MappingProxyType({
+        'note': 'note',
+        'rest': 'rest',
+        'measure': 'measure',
+        'staff': 'staff',
+        'clef': 'clef',
+        'key': 'keySig',
+        'time': 'meterSig',
+        'barline': 'barLine',
+        'articulation': 'artic',
+        'dynamics': 'dynam',
+        'chord': 'chord'
+    }),
+    'mei_to_cmme': MappingProxyType({
+        'note': 'note',
+        'rest': 'rest',
+        'measure': 'measure',
+        'staff': 'staff',
+        'clef': 'clef',
+        'keySig': 'key',
+        'meterSig': 'time',
+        'barLine': 'barline',
+        'artic': 'articulation',
+        'dynam': 'dynamics',
+        'chord': 'chord'
+    }),
+    'cmme_to_json': MappingProxyType({
+        'note': 'notes',
+        'rest': 'rests',
+        'measure': 'measures',
+        'staff': 'staves',
+        'clef': 'clefs',
+        'key': 'keys',
+        'time': 'time_signatures',
+        'metadata': 'metadata'
+    }),
+    'mei_to_json': MappingProxyType({
+        'note': 'notes',
+        'rest': 'rests',
+        'measure': 'measures',
+        'staff': 'staves',
+        'clef': 'clefs',
+        'keySig': 'keys',
+        'meterSig': 'time_signatures',
+        'metadata': 'metadata'
+    }),
+    'json_to_cmme': MappingProxyType({
+        'notes': 'note',
+        'rests': 'rest',
+        'measures': 'measure',
+        'staves': 'staff',
+        'clefs': 'clef',
+        'keys': 'key',
+        'time_signatures': 'time',
+        'metadata': 'metadata'
+    }),
+    'json_to_mei': MappingProxyType({
+        'notes': 'note',
+        'rests': 'rest',
+        'measures': 'measure',
+        'staves': 'staff',
+        'clefs': 'clef',
+        'keys': 'keySig',
+        'time_signatures': 'meterSig',
+        'metadata': 'metadata'
+    })
+})
+
+# Attribute mappings between different formats
+_ATTRIBUTE_MAPPINGS = MappingProxyType({
+    'cmme_to_mei': MappingProxyType({
+        'pitch': ('pname', 'oct'),
+        'duration': 'dur',
+        'stem-direction': 'stem.dir',
+        'id': 'xml:id',
+        'accidental': 'accid'
+    }),
+    'mei_to_cmme': MappingProxyType({
+        'pname': 'pitch',
+        'oct': 'pitch',
+        'dur': 'duration',
+        'stem.dir': 'stem-direction',
+        'xml:id': 'id',
+        'accid': 'accidental'
+    })
+})
+
+# Element weights for importance in accuracy calculation
+_ELEMENT_WEIGHTS = MappingProxyType({
+    'note': 10,      # Notes are most important
+    'rest': 8,       # Rests are important
+    'chord': 10,     # Chords are important
+    'measure': 6,    # Measures are structural
+    'staff': 5,      # Staves are structural
+    'clef': 4,       # Clefs affect reading
+    'key': 4,        # Key signatures affect reading
+    'keySig': 4,     # Key signatures (MEI)
+    'time': 4,       # Time signatures affect rhythm
+    'meterSig': 4,   # Time signatures (MEI)
+    'barline': 3,    # Barlines are structural
+    'barLine': 3,    # Barlines (MEI)
+    'articulation': 3, # Articulations affect performance
+    'artic': 3,      # Articulations (MEI)
+    'dynamics': 3,   # Dynamics affect performance
+    'dynam': 3,      # Dynamics (MEI)
+    'default': 1     # Default weight for unspecified elements
+})
+
+# Attributes weights for importance
+_ATTRIBUTE_WEIGHTS = MappingProxyType({
+    'pitch': 10,     # Pitch is critical
+    'pname': 10,     # Pitch name (MEI)
+    'oct': 10,       # Octave (MEI)
+    'duration': 10,  # Duration is critical
+    'dur': 10,       # Duration (MEI)
+    'accidental': 8, # Accidentals change pitch
+    'accid': 8,      # Accidentals (MEI)
+    'default': 2     # Default weight for unspecified attributes
+})
+
 @dataclass
 class ConversionMetrics:
     """Metrics for conversion quality assessment."""
@@ -30,6 +347,15 @@ class ConversionMetrics:
     conversion_time: float
     memory_usage: float
 
+@dataclass(frozen=True)
+class LossSummary:
+    """Counts over the lost elements and attributes of a data loss report."""
+    total_elements: int
+    musical_elements: int
+    important_attrs: int
+    element_names: FrozenSet[str]
+    attr_names: FrozenSet[str]
+
 @dataclass
 class DataLossReport:
     """Detailed report on data loss during conversion."""
@@ -39,12 +365,17 @@ class DataLossReport:
     context: Dict[str, Any]
     timestamp: str
     severity: str
+    summary: Optional[LossSummary] = field(default=None, repr=False)
 
 class ConversionEvaluator:
     """
     Evaluates conversion quality and generates detailed reports.
     """
 
+    # Elements counted as notes, and as musical content, when comparing documents
+    NOTE_ELEMENTS = ('note', 'rest', 'chord')
+    MUSICAL_ELEMENTS = ('note', 'rest', 'chord', 'measure')
+
     def __init__(self, report_dir: Optional[str] = None):
         """
         Initialize the evaluator.
@@ -57,127 +388,25 @@ class ConversionEvaluator:
         if report_dir and not os.path.exists(report_dir):
             os.makedirs(report_dir)
 
-        # Element mappings between different formats
-        self.element_mappings = {
-            'cmme_to_mei': {
-                'note': 'note',
-                'rest': 'rest',
-                'measure': 'measure',
-                'staff': 'staff',
-                'clef': 'clef',
-                'key': 'keySig',
-                'time': 'meterSig',
-                'barline': 'barLine',
-                'articulation': 'artic',
-                'dynamics': 'dynam',
-                'chord': 'chord'
-            },
-            'mei_to_cmme': {
-                'note': 'note',
-                'rest': 'rest',
-                'measure': 'measure',
-                'staff': 'staff',
-                'clef': 'clef',
-                'keySig': 'key',
-                'meterSig': 'time',
-                'barLine': 'barline',
-                'artic': 'articulation',
-                'dynam': 'dynamics',
-                'chord': 'chord'
-            },
-            'cmme_to_json': {
-                'note': 'notes',
-                'rest': 'rests',
-                'measure': 'measures',
-                'staff': 'staves',
-                'clef': 'clefs',
-                'key': 'keys',
-                'time': 'time_signatures',
-                'metadata': 'metadata'
-            },
-            'mei_to_json': {
-                'note': 'notes',
-                'rest': 'rests',
-                'measure': 'measures',
-                'staff': 'staves',
-                'clef': 'clefs',
-                'keySig': 'keys',
-                'meterSig': 'time_signatures',
-                'metadata': 'metadata'
-            },
-            'json_to_cmme': {
-                'notes': 'note',
-                'rests': 'rest',
-                'measures': 'measure',
-                'staves': 'staff',
-                'clefs': 'clef',
-                'keys': 'key',
-                'time_signatures': 'time',
-                'metadata': 'metadata'
-            },
-            'json_to_mei': {
-                'notes': 'note',
-                'rests': 'rest',
-                'measures': 'measure',
-                'staves': 'staff',
-                'clefs': 'clef',
-                'keys': 'keySig',
-                'time_signatures': 'meterSig',
-                'metadata': 'metadata'
-            }
-        }
-        
-        # Attribute mappings between different formats
-        self.attribute_mappings = {
-            'cmme_to_mei': {
-                'pitch': ['pname', 'oct'],
-                'duration': 'dur',
-                'stem-direction': 'stem.dir',
-                'id': 'xml:id',
-                'accidental': 'accid'
-            },
-            'mei_to_cmme': {
-                'pname': 'pitch',
-                'oct': 'pitch',
-                'dur': 'duration',
-                'stem.dir': 'stem-direction',
-                'xml:id': 'id',
-                'accid': 'accidental'
-            }
-        }
-        
-        # Element weights for importance in accuracy calculation
-        self.element_weights = {
-            'note': 10,      # Notes are most important
-            'rest': 8,       # Rests are important
-            'chord': 10,     # Chords are important
-            'measure': 6,    # Measures are structural
-            'staff': 5,      # Staves are structural
-            'clef': 4,       # Clefs affect reading
-            'key': 4,        # Key signatures affect reading
-            'keySig': 4,     # Key signatures (MEI)
-            'time': 4,       # Time signatures affect rhythm
-            'meterSig': 4,   # Time signatures (MEI)
-            'barline': 3,    # Barlines are structural
-            'barLine': 3,    # Barlines (MEI)
-            'articulation': 3, # Articulations affect performance
-            'artic': 3,      # Articulations (MEI)
-            'dynamics': 3,   # Dynamics affect performance
-            'dynam': 3,      # Dynamics (MEI)
-            'default': 1     # Default weight for unspecified elements
-        }
-        
-        # Attributes weights for importance
-        self.attribute_weights = {
-            'pitch': 10,     # Pitch is critical
-            'pname': 10,     # Pitch name (MEI)
-            'oct': 10,       # Octave (MEI)
-            'duration': 10,  # Duration is critical
-            'dur': 10,       # Duration (MEI)
-            'accidental': 8, # Accidentals change pitch
-            'accid': 8,      # Accidentals (MEI)
-            'default': 2     # Default weight for unspecified attributes
-        }
+        # Read-only tables shared by every evaluator
+        self.element_mappings = _ELEMENT_MAPPINGS
+        self.attribute_mappings = _ATTRIBUTE_MAPPINGS
+        self.element_weights = _ELEMENT_WEIGHTS
+        self.attribute_weights = _ATTRIBUTE_WEIGHTS
+
+        # psutil handle for this process, created on first memory reading
+        self._process = None
+
+        # Report file names: the formatted second is reused while it lasts and a
+        # sequence number keeps reports saved within the same second apart
+        self._report_second = None
+        self._report_stamp = ''
+        self._report_sequence = count(1)
+
+        # Serialized reports waiting for the writer thread, started on first save
+        self._report_queue: Queue = Queue()
+        self._report_writer = None
+        self._report_writer_lock = threading.Lock()
 
     def _analyze_format_features(self, source_root: etree._Element, 
                              result_root: etree._Element,
@@ -220,21 +449,21 @@ class ConversionEvaluator:
         features = []
         
         # Check for ligatures in CMME
-        ligatures = source_root.xpath("//ligature")
+        ligatures = int(_XP_LIGATURE_COUNT(source_root))
         if ligatures:
             features.append({
                 "feature": "ligatures",
-                "count": len(ligatures),
+                "count": ligatures,
                 "description": "Ligature notations may be transformed in conversion",
                 "impact": "medium"  # Changed from "lost" to "transformed"
             })
         
         # Check for mensuration signs
-        mensurations = source_root.xpath("//mensuration")
+        mensurations = int(_XP_MENSURATION_COUNT(source_root))
         if mensurations:
             features.append({
                 "feature": "mensuration",
-                "count": len(mensurations),
+                "count": mensurations,
                 "description": "Mensuration signs may be represented differently in the target format",
                 "impact": "medium"  # Changed from "lost" to "represented differently"
             })
@@ -255,25 +484,22 @@ class ConversionEvaluator:
         """
         features = []
         
-        # Define MEI namespace for proper XPath queries
-        ns = {'mei': 'http://www.music-encoding.org/ns/mei'}
-        
         # Check for editorial markup
-        editorial = source_root.xpath("//mei:supplied|//mei:unclear|//mei:sic|//mei:corr", namespaces=ns)
+        editorial = int(_XP_MEI_EDITORIAL_COUNT(source_root))
         if editorial:
             features.append({
                 "feature": "editorial_markup",
-                "count": len(editorial),
+                "count": editorial,
                 "description": "Editorial markups may be represented differently in the target format",
                 "impact": "low"  # Changed from "lost" to "represented differently"
             })
         
         # Check for advance notations
-        neumes = source_root.xpath("//mei:neume", namespaces=ns)
+        neumes = int(_XP_MEI_NEUME_COUNT(source_root))
         if neumes:
             features.append({
                 "feature": "neume_notation",
-                "count": len(neumes),
+                "count": neumes,
                 "description": "Neume notations may require special handling in the target format",
                 "impact": "medium"  # Changed from "lost" to "special handling"
             })
@@ -295,8 +521,8 @@ class ConversionEvaluator:
         changes = []
         
         # Compare basic document structure
-        source_depth = max(len(elem.xpath("ancestor::*")) for elem in source_root.xpath("//*"))
-        result_depth = max(len(elem.xpath("ancestor::*")) for elem in result_root.xpath("//*"))
+        source_depth = self._max_depth(source_root)
+        result_depth = self._max_depth(result_root)
         
         if source_depth != result_depth:
             changes.append({
@@ -308,8 +534,8 @@ class ConversionEvaluator:
             })
         
         # Compare number of elements
-        source_count = len(source_root.xpath("//*"))
-        result_count = len(result_root.xpath("//*"))
+        source_count = int(_XP_ALL_COUNT(source_root))
+        result_count = int(_XP_ALL_COUNT(result_root))
         
         if abs(source_count - result_count) > max(1, source_count * 0.05):  # Allow 5% difference
             changes.append({
@@ -321,10 +547,8 @@ class ConversionEvaluator:
             })
         
         # Compare number of measures if applicable
-        source_measures = len(source_root.xpath("//measure")) or len(source_root.xpath("//mei:measure", 
-                                                                                namespaces={'mei': 'http://www.music-encoding.org/ns/mei'}))
-        result_measures = len(result_root.xpath("//measure")) or len(result_root.xpath("//mei:measure", 
-                                                                                namespaces={'mei': 'http://www.music-encoding.org/ns/mei'}))
+        source_measures = int(_XP_MEASURE_COUNT(source_root))
+        result_measures = int(_XP_MEASURE_COUNT(result_root))
         
         if source_measures != result_measures:
             changes.append({
@@ -337,17 +561,47 @@ class ConversionEvaluator:
         
         return changes
 
-    def _extract_metadata(self, root: etree._Element, format_type: str) -> Dict[str, Any]:
+    def _max_depth(self, root: etree._Element) -> int:
+        """
+        Get the depth of the deepest element below root.
+
+        Args:
+            root (etree._Element): Root element
+
+        Returns:
+            int: Maximum number of element ancestors of any element
+        """
+        max_depth = 0
+        stack = [(root, 0)]
+        while stack:
+            elem, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            stack.extend((child, depth + 1) for child in elem.iterchildren(etree.Element))
+        return max_depth
+
+    def _extract_metadata(self, root: etree._Element, format_type: str) -> Mapping[str, Any]:
         """
         Extract metadata from XML document based on format.
         
+        For trees from the document cache the result is stored in the cache
+        entry, since cached documents are evaluated and analyzed repeatedly,
+        and is dropped along with the tree.
+        
         Args:
             root (etree._Element): Root element
             format_type (str): Format type ('cmme' or 'mei')
             
         Returns:
-            Dict[str, Any]: Extracted metadata
+            Mapping[str, Any]: Extracted metadata (read-only)
         """
+        with _DOCUMENT_CACHE_LOCK:
+            entry = _DOCUMENT_CACHE.get(_DOCUMENT_KEYS.get(id(root)))
+            if entry is not None and entry.root is not root:
+                entry = None
+            if entry is not None and format_type in entry.metadata:
+                return entry.metadata[format_type]
+        
         metadata = {}
         
         try:
@@ -358,29 +612,35 @@ class ConversionEvaluator:
                     for child in meta_elem:
                         metadata[child.tag] = child.text
             elif format_type == 'mei':
-                # Define MEI namespace
-                ns = {'mei': 'http://www.music-encoding.org/ns/mei'}
-                
-                # Extract title
-                title = root.xpath(".//mei:title", namespaces=ns)
-                if title:
-                    metadata['title'] = title[0].text
-                
-                # Extract composer
-                composer = root.xpath(".//mei:composer", namespaces=ns)
-                if composer:
-                    metadata['composer'] = composer[0].text
-                    
-                # Extract other metadata
-                filedesc = root.xpath(".//mei:fileDesc/*", namespaces=ns)
-                for elem in filedesc:
-                    # Extract tag name without namespace
-                    tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                    if tag not in ['title', 'composer'] and elem.text:
-                        metadata[tag] = elem.text
+                # Find the first title and composer and collect fileDesc
+                # children in one filtered walk
+                title = composer = None
+                other = {}
+                for elem in root.iterdescendants(_MEI_TITLE, _MEI_COMPOSER, _MEI_FILEDESC):
+                    if elem.tag == _MEI_FILEDESC:
+                        for child in elem.iterchildren(etree.Element):
+                            # Extract tag name without namespace
+                            tag = child.tag.rpartition('}')[2]
+                            if tag not in ('title', 'composer') and child.text:
+                                other[tag] = child.text
+                    elif elem.tag == _MEI_TITLE:
+                        if title is None:
+                            title = elem
+                    elif composer is None:
+                        composer = elem
+                
+                if title is not None:
+                    metadata['title'] = title.text
+                if composer is not None:
+                    metadata['composer'] = composer.text
+                metadata.update(other)
         except Exception as e:
             self.logger.warning(f"Error extracting metadata: {str(e)}")
         
+        metadata = MappingProxyType(metadata)
+        if entry is not None:
+            with _DOCUMENT_CACHE_LOCK:
+                metadata = entry.metadata.setdefault(format_type, metadata)
         return metadata
 
     def _extract_notes_from_json(self, json_data: Dict) -> List[Dict]:
@@ -407,6 +667,27 @@ class ConversionEvaluator:
         
         return notes
 
+    def _count_notes_from_json(self, json_data: Dict) -> int:
+        """Count the notes _extract_notes_from_json would return, without building the list."""
+        if 'notes' in json_data:
+            return len(json_data['notes'])
+
+        count = 0
+        if 'parts' in json_data:
+            for part in json_data['parts']:
+                if 'measures' in part:
+                    for measure in part['measures']:
+                        if 'events' in measure:
+                            count += sum(1 for event in measure['events']
+                                         if event.get('type') == 'note')
+                        elif 'notes' in measure:
+                            count += len(measure['notes'])
+                        elif 'contents' in measure:
+                            count += sum(1 for content in measure['contents']
+                                         if content.get('type') == 'note')
+
+        return count
+
     def _extract_metadata_from_json(self, json_data: Dict) -> Dict:
         """Extract metadata from JSON data."""
         if 'metadata' in json_data:
@@ -423,21 +704,30 @@ class ConversionEvaluator:
         Returns:
             str: Structure representation
         """
-        def _elem_to_struct(elem, level=0):
-            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-            result = ' ' * level + tag
-            for child in elem:
-                result += '\n' + _elem_to_struct(child, level + 2)
-            return result
-        
-        return _elem_to_struct(root)
-
-    def _validate_mei(self, xml_content: str) -> List[str]:
+        # Pre-order walk with an explicit stack; lines are joined once at the end.
+        # Namespaces are stripped once per distinct tag, not once per element.
+        lines = []
+        local_names = {}
+        stack = [(root, 0)]
+        while stack:
+            elem, level = stack.pop()
+            tag = elem.tag
+            name = local_names.get(tag)
+            if name is None:
+                name = local_names[tag] = tag.rpartition('}')[2]
+            lines.append(' ' * level + name)
+            stack.extend((child, level + 2) for child in reversed(elem))
+        return '\n'.join(lines)
+
+    def _validate_mei(self, xml_content: str,
+                      root: Optional[etree._Element] = None) -> List[str]:
         """
         Validate MEI-specific constraints.
         
         Args:
             xml_content (str): MEI XML content
+            root (etree._Element, optional): Already parsed root of the content;
+                when given the tree is walked instead of reparsing the text
             
         Returns:
             List[str]: List of validation errors
@@ -445,28 +735,44 @@ class ConversionEvaluator:
         errors = []
         
         try:
-            root = etree.fromstring(xml_content.encode('utf-8'))
+            # Walk elements in document order, streaming the text when no tree
+            # was given, and stop once every required element was seen
+            if root is None:
+                events = etree.iterparse(BytesIO(xml_content.encode('utf-8')), events=('start',),
+                                         **_ITERPARSE_OPTIONS)
+                elements = (elem for _, elem in events)
+            else:
+                elements = root.iter(etree.Element)
+            root = next(elements)
             
             # Check for MEI namespace
-            if not root.nsmap.get(None) == 'http://www.music-encoding.org/ns/mei':
+            if not root.nsmap.get(None) == _MEI_NS:
                 errors.append("Missing MEI namespace")
             
             # Check required elements
-            required_elements = ['music', 'body', 'mdiv', 'score']
-            for elem in required_elements:
-                if not root.xpath(f"//mei:{elem}", namespaces={'mei': 'http://www.music-encoding.org/ns/mei'}):
+            pending = {f'{{{_MEI_NS}}}{elem}' for elem in _MEI_REQUIRED_ELEMENTS}
+            pending.discard(root.tag)
+            for elem in elements:
+                pending.discard(elem.tag)
+                if not pending:
+                    break
+            for elem in _MEI_REQUIRED_ELEMENTS:
+                if f'{{{_MEI_NS}}}{elem}' in pending:
                     errors.append(f"Missing required element: {elem}")
         except Exception as e:
             errors.append(f"MEI validation error: {str(e)}")
         
         return errors
 
-    def _validate_cmme(self, xml_content: str) -> List[str]:
+    def _validate_cmme(self, xml_content: str,
+                       root: Optional[etree._Element] = None) -> List[str]:
         """
         Validate CMME-specific constraints.
         
         Args:
             xml_content (str): CMME XML content
+            root (etree._Element, optional): Already parsed root of the content;
+                when given the tree is walked instead of reparsing the text
             
         Returns:
             List[str]: List of validation errors
@@ -474,17 +780,31 @@ class ConversionEvaluator:
         errors = []
         
         try:
-            root = etree.fromstring(xml_content.encode('utf-8'))
+            # Walk elements in document order, streaming the text when no tree
+            # was given, and stop once every required section was seen
+            if root is None:
+                events = etree.iterparse(BytesIO(xml_content.encode('utf-8')), events=('start',),
+                                         **_ITERPARSE_OPTIONS)
+                elements = (elem for _, elem in events)
+            else:
+                elements = root.iter(etree.Element)
+            root = next(elements)
             
             # Check root element
             if root.tag != 'cmme':
                 errors.append("Root element must be <cmme>")
             
             # Check required elements
-            if not root.find(".//metadata"):
+            pending = {'metadata', 'score'}
+            for elem in elements:
+                pending.discard(elem.tag)
+                if not pending:
+                    break
+            
+            if 'metadata' in pending:
                 errors.append("Missing metadata section")
             
-            if not root.find(".//score"):
+            if 'score' in pending:
                 errors.append("Missing score section")
         except Exception as e:
             errors.append(f"CMME validation error: {str(e)}")
@@ -501,14 +821,230 @@ class ConversionEvaluator:
         Returns:
             str: Normalized XML content
         """
+        data = xml_content.encode('utf-8')
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        with _NORMALIZED_CACHE_LOCK:
+            normalized = _NORMALIZED_CACHE.get(key)
+            if normalized is not None:
+                _NORMALIZED_CACHE.move_to_end(key)
+                return normalized
+
         try:
-            parser = etree.XMLParser(remove_blank_text=True, remove_comments=True)
-            root = etree.fromstring(xml_content.encode('utf-8'), parser)
-            return etree.tostring(root, encoding='unicode')
+            root = etree.fromstring(data, _NORMALIZE_PARSER)
+            normalized = etree.tostring(root, encoding='unicode')
         except Exception as e:
             self.logger.warning(f"Error normalizing XML: {str(e)}")
             return xml_content
+
+        with _NORMALIZED_CACHE_LOCK:
+            _NORMALIZED_CACHE[key] = normalized
+            if len(_NORMALIZED_CACHE) > _NORMALIZED_CACHE_SIZE:
+                _NORMALIZED_CACHE.popitem(last=False)
+        return normalized
         
+    def _tally(self, root: etree._Element) -> Tuple[int, int, Counter]:
+        """
+        Count the elements of a tree in a single pass.
+
+        Args:
+            root (etree._Element): XML root element
+
+        Returns:
+            Tuple[int, int, Counter]: Element count, weighted element count and
+                counts per tag as written (namespaced tags in Clark notation)
+        """
+        tag_counts = Counter(elem.tag for elem in root.iter(etree.Element))
+        default_weight = self.element_weights['default']
+        weighted_total = sum(
+            count * self.element_weights.get(tag.rpartition('}')[2], default_weight)
+            for tag, count in tag_counts.items()
+        )
+        return sum(tag_counts.values()), weighted_total, tag_counts
+
+    def _bucket_by_tag(self, root: etree._Element,
+                       tags: Optional[Set[str]] = None) -> Dict[str, List[etree._Element]]:
+        """
+        Group the elements of a tree by tag in a single pass.
+
+        Args:
+            root (etree._Element): XML root element
+            tags (Set[str], optional): Only collect these tags (namespaced tags in
+                Clark notation); lxml matches them while walking the tree, so
+                other elements are skipped without creating Python proxies
+
+        Returns:
+            Dict[str, List[etree._Element]]: Elements per tag as written (namespaced
+                tags in Clark notation), each list in document order
+        """
+        buckets = defaultdict(list)
+        if tags is not None and not tags:
+            return buckets
+        for elem in root.iter(*tags) if tags else root.iter(etree.Element):
+            buckets[elem.tag].append(elem)
+        return buckets
+
+    def _target_tags(self, tags: List[str], conversion_type: str) -> Set[str]:
+        """
+        Get the result tags _target_elements may look up for the given target tags.
+
+        Args:
+            tags (List[str]): Target tag names without namespace
+            conversion_type (str): Type of conversion (e.g., 'cmme_to_mei')
+
+        Returns:
+            Set[str]: Tags to collect from the result tree
+        """
+        target_tags = set(tags)
+        if conversion_type.endswith('_to_mei'):
+            target_tags.update(f'{{{_MEI_NS}}}{tag}' for tag in tags)
+        return target_tags
+
+    def _target_elements(self, buckets: Dict[str, List[etree._Element]],
+                         tag: str, conversion_type: str) -> List[etree._Element]:
+        """
+        Look up result elements for a mapped tag.
+
+        MEI results are matched in the MEI namespace first and fall back to
+        unqualified tags when none are found.
+
+        Args:
+            buckets (Dict[str, List[etree._Element]]): Result elements from _bucket_by_tag
+            tag (str): Target tag name without namespace
+            conversion_type (str): Type of conversion (e.g., 'cmme_to_mei')
+
+        Returns:
+            List[etree._Element]: Matching elements in document order
+        """
+        if conversion_type.endswith('_to_mei'):
+            return buckets.get(f'{{{_MEI_NS}}}{tag}') or buckets.get(tag, [])
+        return buckets.get(tag, [])
+
+    def _parse_document(self, content: Any) -> etree._Element:
+        """
+        Parse XML content, reusing the tree when the same content was parsed recently.
+
+        evaluate_conversion and analyze_data_loss are typically run back to back
+        on the same pair of documents. The cached tree is shared and must not be
+        modified by callers.
+
+        Args:
+            content (Any): XML content as text, or as UTF-8 encoded bytes which
+                are parsed without another encoding pass
+
+        Returns:
+            etree._Element: Root element of the parsed document
+
+        Raises:
+            etree.XMLSyntaxError: If the content is not well-formed XML
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        with _DOCUMENT_CACHE_LOCK:
+            entry = _DOCUMENT_CACHE.get(key)
+            if entry is not None:
+                _DOCUMENT_CACHE.move_to_end(key)
+                return entry.root
+
+        root = etree.fromstring(data, _XML_PARSER)
+
+        with _DOCUMENT_CACHE_LOCK:
+            # Keep the first tree if another thread parsed the same content
+            entry = _DOCUMENT_CACHE.get(key)
+            if entry is None:
+                entry = _DOCUMENT_CACHE[key] = _CachedDocument(root, {}, len(data))
+                _DOCUMENT_KEYS[id(root)] = key
+                cached_bytes = sum(cached.size for cached in _DOCUMENT_CACHE.values())
+                while len(_DOCUMENT_CACHE) > 1 and (len(_DOCUMENT_CACHE) > _DOCUMENT_CACHE_SIZE
+                                                    or cached_bytes > _DOCUMENT_CACHE_BYTES):
+                    evicted = _DOCUMENT_CACHE.popitem(last=False)[1]
+                    del _DOCUMENT_KEYS[id(evicted.root)]
+                    cached_bytes -= evicted.size
+        return entry.root
+
+    def _load_json(self, content: Any) -> Any:
+        """
+        Parse JSON content, reusing the data when the same content was parsed recently.
+
+        Like _parse_document, this lets analyze_data_loss reuse the document
+        evaluate_conversion just decoded. The cached data is shared and must not
+        be modified by callers.
+
+        Args:
+            content (Any): JSON text, or already decoded data which is returned as is
+
+        Returns:
+            Any: Decoded JSON data
+
+        Raises:
+            ValueError: If the content is not valid JSON
+        """
+        if not isinstance(content, str):
+            return content
+
+        data = content.encode('utf-8')
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        with _JSON_CACHE_LOCK:
+            if key in _JSON_CACHE:
+                _JSON_CACHE.move_to_end(key)
+                return _JSON_CACHE[key]
+
+        parsed = _json_loads(data)
+
+        with _JSON_CACHE_LOCK:
+            _JSON_CACHE[key] = parsed
+            if len(_JSON_CACHE) > _JSON_CACHE_SIZE:
+                _JSON_CACHE.popitem(last=False)
+        return parsed
+
+    def _analyze_source(self, source: str) -> _SourceAnalysis:
+        """
+        Parse and tally an XML source, reusing the result for repeated sources.
+
+        Evaluating one source against several conversions would otherwise
+        recount it every time. The tree comes from _parse_document, so it is
+        shared and must not be modified by callers.
+
+        Args:
+            source (str): Normalized XML source content
+
+        Returns:
+            _SourceAnalysis: Source root with its element counts
+        """
+        data = source.encode('utf-8')
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        root = self._parse_document(data)
+        with _SOURCE_CACHE_LOCK:
+            tally = _SOURCE_CACHE.get(key)
+            if tally is not None:
+                _SOURCE_CACHE.move_to_end(key)
+                return _SourceAnalysis(root, *tally)
+
+        tally = self._tally(root)
+
+        with _SOURCE_CACHE_LOCK:
+            _SOURCE_CACHE[key] = tally
+            if len(_SOURCE_CACHE) > _SOURCE_CACHE_SIZE:
+                _SOURCE_CACHE.popitem(last=False)
+        return _SourceAnalysis(root, *tally)
+
+    def _count_preserved_metadata(self, source_metadata: Dict, result_metadata: Dict) -> int:
+        """
+        Count source metadata entries that appear unchanged in the result.
+
+        Args:
+            source_metadata (Dict): Metadata extracted from the source
+            result_metadata (Dict): Metadata extracted from the result
+
+        Returns:
+            int: Number of keys present in both with equal values
+        """
+        try:
+            return len(source_metadata.items() & result_metadata.items())
+        except TypeError:
+            # Unhashable values (lists or objects from JSON) need a per-key comparison
+            return sum(1 for k, v in source_metadata.items()
+                       if k in result_metadata and result_metadata[k] == v)
+
     def _count_elements_and_attributes(self, root: etree._Element) -> tuple:
         """
         Count elements and attributes by type in an XML tree.
@@ -519,25 +1055,23 @@ class ConversionEvaluator:
         Returns:
             Tuple[Dict[str, int], Dict[str, int]]: Element counts and attribute counts
         """
+        # Tally raw names in one pass over the elements (comments and PIs have no tag name)
+        raw_elements = Counter()
+        raw_attributes = Counter()
+        for element in root.iter(etree.Element):
+            raw_elements[element.tag] += 1
+            raw_attributes.update(element.keys())
+        
+        # Strip namespaces once per distinct name rather than once per occurrence
         element_counts = {}
-        attribute_counts = {}
+        for tag, count in raw_elements.items():
+            tag = tag.rpartition('}')[2]
+            element_counts[tag] = element_counts.get(tag, 0) + count
         
-        # Handle namespace-prefixed elements
-        for element in root.iter():
-            # Get tag name without namespace
-            tag = element.tag
-            if '}' in tag:
-                tag = tag.split('}', 1)[1]
-                
-            element_counts[tag] = element_counts.get(tag, 0) + 1
-            
-            # Count attributes
-            for attr_name in element.attrib:
-                # Remove namespace from attribute name if present
-                if '}' in attr_name:
-                    attr_name = attr_name.split('}', 1)[1]
-                
-                attribute_counts[attr_name] = attribute_counts.get(attr_name, 0) + 1
+        attribute_counts = {}
+        for attr_name, count in raw_attributes.items():
+            attr_name = attr_name.rpartition('}')[2]
+            attribute_counts[attr_name] = attribute_counts.get(attr_name, 0) + count
         
         return element_counts, attribute_counts
 
@@ -554,8 +1088,7 @@ class ConversionEvaluator:
         """
         # Replace ns0: prefix with mei:
         if 'ns0:mei' in xml_string and 'xmlns:ns0' in xml_string:
-            xml_string = xml_string.replace('ns0:', 'mei:')
-            xml_string = xml_string.replace('xmlns:ns0=', 'xmlns:mei=')
+            xml_string = _NS0_RE.sub(lambda match: _NS0_REPL[match.group(0)], xml_string)
         
         return xml_string
 
@@ -583,29 +1116,20 @@ class ConversionEvaluator:
             
             # For JSON data, we need special handling
             if conversion_type.endswith('_to_json'):
-                # Parse XML source
-                source_root = etree.fromstring(source.encode('utf-8'))
+                # Parse and count the XML source
+                source_root, total_elements, weighted_total, source_tags = self._analyze_source(source)
                 
                 # Parse JSON result
-                if isinstance(result, str):
-                    result_data = json.loads(result)
-                else:
-                    result_data = result
-                
-                # Count elements for XML source
-                total_elements = len(source_root.xpath('//*'))
+                result_data = self._load_json(result)
                 
-                # Extract and count key data from JSON
-                source_notes = []
-                for tag in ['note', 'rest', 'chord']:
-                    source_notes.extend(source_root.xpath(f'//{tag}'))
+                source_note_count = sum(source_tags[tag] for tag in self.NOTE_ELEMENTS)
                 
-                # Extract notes from JSON
-                result_notes = self._extract_notes_from_json(result_data)
+                # Count notes in JSON
+                result_note_count = self._count_notes_from_json(result_data)
                 
                 # Basic metrics
-                preserved_count = min(len(source_notes), len(result_notes))
-                lost_count = max(0, len(source_notes) - len(result_notes))
+                preserved_count = min(source_note_count, result_note_count)
+                lost_count = max(0, source_note_count - result_note_count)
                 modified_count = 0  # Hard to determine for JSON
                 
                 # Check metadata preservation
@@ -614,8 +1138,8 @@ class ConversionEvaluator:
                 
                 metadata_score = 1.0  # Default to perfect
                 if source_metadata:
-                    preserved_metadata = sum(1 for k, v in source_metadata.items() 
-                                        if k in result_metadata and result_metadata[k] == v)
+                    preserved_metadata = self._count_preserved_metadata(source_metadata,
+                                                                        result_metadata)
                     metadata_score = preserved_metadata / len(source_metadata)
                 
                 # Calculate structural integrity - challenging for XML to JSON
@@ -623,17 +1147,6 @@ class ConversionEvaluator:
                 
                 # Improve accuracy calculation with a weighted approach
                 # Focus more on notes than structural elements
-                weighted_total = 0
-                weighted_preserved = 0
-                
-                for elem in source_root.xpath('//*'):
-                    tag = elem.tag
-                    if '}' in tag:
-                        tag = tag.split('}')[-1]
-                    
-                    weight = self.element_weights.get(tag, self.element_weights['default'])
-                    weighted_total += weight
-                
                 # Notes are most important, so use them for weighted preservation
                 weighted_preserved = preserved_count * self.element_weights.get('note', 10)
                 
@@ -644,7 +1157,7 @@ class ConversionEvaluator:
                     accuracy = min(1.0, max(0.0, weighted_preserved / weighted_total))
                     
                     # Boost accuracy if all notes are preserved
-                    if preserved_count == len(source_notes) and len(source_notes) > 0:
+                    if preserved_count == source_note_count and source_note_count > 0:
                         accuracy = max(accuracy, 0.85)
                     
                     # Further adjust based on metadata preservation
@@ -652,28 +1165,21 @@ class ConversionEvaluator:
                 
             elif conversion_type.startswith('json_to_'):
                 # Parse JSON source
-                if isinstance(source, str):
-                    source_data = json.loads(source)
-                else:
-                    source_data = source
+                source_data = self._load_json(source)
                 
                 # Parse XML result
-                result_root = etree.fromstring(result.encode('utf-8'))
-                
-                # Extract notes from JSON
-                source_notes = self._extract_notes_from_json(source_data)
+                result_root = self._parse_document(result)
                 
-                # Count elements for XML result
-                total_elements = len(result_root.xpath('//*'))
+                # Count notes in JSON
+                source_note_count = self._count_notes_from_json(source_data)
                 
-                # Find notes in result
-                result_notes = []
-                for tag in ['note', 'rest', 'chord']:
-                    result_notes.extend(result_root.xpath(f'//{tag}'))
+                # Count elements and notes for XML result in one pass
+                total_elements, _, result_tags = self._tally(result_root)
+                result_note_count = sum(result_tags[tag] for tag in self.NOTE_ELEMENTS)
                 
                 # Basic metrics
-                preserved_count = min(len(source_notes), len(result_notes))
-                lost_count = max(0, len(source_notes) - len(result_notes))
+                preserved_count = min(source_note_count, result_note_count)
+                lost_count = max(0, source_note_count - result_note_count)
                 modified_count = 0  # Hard to determine for JSON
                 
                 # Check metadata preservation
@@ -682,36 +1188,23 @@ class ConversionEvaluator:
                 
                 metadata_score = 1.0  # Default to perfect
                 if source_metadata:
-                    preserved_metadata = sum(1 for k, v in source_metadata.items() 
-                                        if k in result_metadata and result_metadata[k] == v)
+                    preserved_metadata = self._count_preserved_metadata(source_metadata,
+                                                                        result_metadata)
                     metadata_score = preserved_metadata / len(source_metadata)
                 
                 # Calculate structural integrity - challenging for JSON to XML
                 structural_score = 0.9  # Default to high for JSON conversion
                 
                 # Improve accuracy calculation
-                accuracy = min(1.0, preserved_count / max(1, len(source_notes)))
+                accuracy = min(1.0, preserved_count / max(1, source_note_count))
                 
                 # Adjust based on metadata
                 accuracy = accuracy * 0.9 + metadata_score * 0.1
                 
             else:
                 # XML to XML conversion
-                source_root = etree.fromstring(source.encode('utf-8'))
-                result_root = etree.fromstring(result.encode('utf-8'))
-
-                # Count total elements with weights
-                total_elements = len(source_root.xpath('//*'))
-                weighted_total = 0
-                
-                # Count with weights
-                for elem in source_root.xpath('//*'):
-                    tag = elem.tag
-                    if '}' in tag:
-                        tag = tag.split('}')[-1]
-                    
-                    weight = self.element_weights.get(tag, self.element_weights['default'])
-                    weighted_total += weight
+                source_root, total_elements, weighted_total, source_tags = self._analyze_source(source)
+                result_root = self._parse_document(result)
                 
                 # Initialize preservation counters
                 preserved_count = 0
@@ -719,56 +1212,61 @@ class ConversionEvaluator:
                 modified_count = 0
                 weighted_preserved = 0
                 
-                # Get mappings for this conversion type
+                # Bind the per-conversion tables once for the loops below
                 mappings = self.element_mappings.get(conversion_type, {})
+                attr_mappings = self.attribute_mappings.get(conversion_type, {})
+                weights = self.element_weights
+                default_weight = weights['default']
                 
                 # Count musical elements - these are what really matter
-                musical_elements = ['note', 'rest', 'chord', 'measure']
-                source_musical_count = sum(len(source_root.xpath(f'//{tag}')) for tag in musical_elements)
+                source_musical_count = sum(source_tags[tag] for tag in self.MUSICAL_ELEMENTS)
                 
-                # Count corresponding elements in target
+                # Count corresponding elements in target; the count is only used
+                # against source musical content, so skip the walk without any
                 target_musical_count = 0
-                for source_tag in musical_elements:
-                    target_tag = mappings.get(source_tag, source_tag)
-                    
-                    # Handle namespaces in MEI
-                    if conversion_type.endswith('_to_mei'):
-                        target_elements = result_root.xpath(f'//mei:{target_tag}', 
-                                                        namespaces={'mei': 'http://www.music-encoding.org/ns/mei'})
-                        if not target_elements:  # Try without namespace
-                            target_elements = result_root.xpath(f'//{target_tag}')
-                    else:
-                        target_elements = result_root.xpath(f'//{target_tag}')
-                    
-                    target_musical_count += len(target_elements)
+                if source_musical_count > 0:
+                    _, _, result_tags = self._tally(result_root)
+                    for source_tag in self.MUSICAL_ELEMENTS:
+                        target_tag = mappings.get(source_tag, source_tag)
+                        
+                        # Handle namespaces in MEI, falling back to unqualified tags
+                        if conversion_type.endswith('_to_mei'):
+                            target_musical_count += (result_tags[f'{{{_MEI_NS}}}{target_tag}']
+                                                     or result_tags[target_tag])
+                        else:
+                            target_musical_count += result_tags[target_tag]
+                
+                # Only mapped tags present in the source can be preserved, lost or
+                # modified; with none, both trees are left unwalked
+                present = {tag: target for tag, target in mappings.items() if source_tags[tag]}
+                
+                # Group the mapped elements by tag once instead of scanning per mapping
+                source_buckets = self._bucket_by_tag(source_root, set(present))
+                result_buckets = self._bucket_by_tag(
+                    result_root, self._target_tags(list(present.values()), conversion_type)
+                )
                 
                 # Process each source tag and target tag
-                for source_tag, target_tag in mappings.items():
-                    # Handle namespaces in MEI
-                    if conversion_type.endswith('_to_mei'):
-                        target_elements = result_root.xpath(f'//mei:{target_tag}', 
-                                                        namespaces={'mei': 'http://www.music-encoding.org/ns/mei'})
-                        if not target_elements:  # Try without namespace
-                            target_elements = result_root.xpath(f'//{target_tag}')
-                    else:
-                        target_elements = result_root.xpath(f'//{target_tag}')
-                    
-                    source_elements = source_root.xpath(f'//{source_tag}')
+                for source_tag, target_tag in present.items():
+                    # Look up both sides in the per-tag buckets
+                    target_elements = self._target_elements(result_buckets, target_tag, conversion_type)
+                    source_elements = source_buckets.get(source_tag, [])
                     
                     # Count basic preservation
-                    element_count = min(len(source_elements), len(target_elements))
+                    source_len = len(source_elements)
+                    element_count = min(source_len, len(target_elements))
                     preserved_count += element_count
                     
-                    # Calculate lost elements
-                    lost_count += max(0, len(source_elements) - len(target_elements))
+                    # Calculate lost elements: source elements beyond the preserved ones
+                    lost_count += source_len - element_count
                     
                     # Calculate weighted preservation 
-                    weight = self.element_weights.get(source_tag, self.element_weights['default'])
+                    weight = weights.get(source_tag, default_weight)
                     weighted_preserved += element_count * weight
                     
                     # Check for modifications in preserved elements
-                    for i in range(min(len(source_elements), len(target_elements))):
-                        if self._compare_elements(source_elements[i], target_elements[i], conversion_type):
+                    for s_elem, t_elem in zip(source_elements, target_elements):
+                        if self._compare_elements(s_elem, t_elem, conversion_type, attr_mappings):
                             modified_count += 1
                 
                 # Calculate metadata and structural scores
@@ -810,8 +1308,11 @@ class ConversionEvaluator:
                         preserved_count = int(music_preservation_ratio * total_elements)
                         lost_count = total_elements - preserved_count
             
-            # Validate result
-            validation_errors = self._validate_result(result, conversion_type)
+            # Validate result, reusing what the branch above already parsed
+            validation_errors = self._validate_result(
+                result, conversion_type,
+                result_data if conversion_type.endswith('_to_json') else result_root
+            )
 
             # Calculate performance metrics
             conversion_time = (datetime.now() - start_time).total_seconds()
@@ -864,35 +1365,36 @@ class ConversionEvaluator:
         lost_elements = []
         lost_attributes = []
         modified_content = []
-        context = defaultdict(list)
+        context = {}
 
         try:
+            # Normalize XML content the same way evaluate_conversion does, so the
+            # documents it already parsed are reused
+            if not source.strip().startswith('{') and not source.strip().startswith('['):
+                source = self._normalize_xml_content(source)
+            if not result.strip().startswith('{') and not result.strip().startswith('['):
+                result = self._normalize_xml_content(result)
+
             # For JSON conversions, use specialized comparison
             if conversion_type.endswith('_to_json'):
                 # XML source to JSON result
-                source_root = etree.fromstring(source.encode('utf-8'))
-                if isinstance(result, str):
-                    json_result = json.loads(result)
-                else:
-                    json_result = result
-                
-                # Extract notes from source XML and result JSON
-                source_notes = []
-                for tag in ['note', 'rest', 'chord']:
-                    source_notes.extend(source_root.xpath(f'//{tag}'))
+                source_root = self._parse_document(source)
+                json_result = self._load_json(result)
                 
-                result_notes = self._extract_notes_from_json(json_result)
+                # Count notes in source XML and result JSON
+                source_note_count = int(_XP_NOTE_COUNT(source_root))
+                result_note_count = self._count_notes_from_json(json_result)
                 
                 # Compare counts to identify loss
-                if len(source_notes) > len(result_notes):
-                    lost_count = len(source_notes) - len(result_notes)
+                if source_note_count > result_note_count:
+                    lost_count = source_note_count - result_note_count
                     lost_elements.append({
                         "element": "musical events",
                         "count": lost_count,
                         "location": "throughout document"
                     })
                 
-                # Compare metadata
+                # Compare metadata; an element without text matches an empty string
                 source_metadata = self._extract_metadata(source_root, conversion_type.split('_')[0])
                 result_metadata = self._extract_metadata_from_json(json_result)
                 
@@ -903,7 +1405,7 @@ class ConversionEvaluator:
                             "element": "metadata",
                             "value": value
                         })
-                    elif result_metadata[key] != value:
+                    elif (result_metadata[key] or '') != (value or ''):
                         modified_content.append({
                             "element": f"metadata.{key}",
                             "original": value,
@@ -912,30 +1414,24 @@ class ConversionEvaluator:
                 
             elif conversion_type.startswith('json_to_'):
                 # JSON source to XML result
-                if isinstance(source, str):
-                    json_source = json.loads(source)
-                else:
-                    json_source = source
-                
-                result_root = etree.fromstring(result.encode('utf-8'))
+                json_source = self._load_json(source)
                 
-                # Extract notes from source JSON and result XML
-                source_notes = self._extract_notes_from_json(json_source)
+                result_root = self._parse_document(result)
                 
-                result_notes = []
-                for tag in ['note', 'rest', 'chord']:
-                    result_notes.extend(result_root.xpath(f'//{tag}'))
+                # Count notes in source JSON and result XML
+                source_note_count = self._count_notes_from_json(json_source)
+                result_note_count = int(_XP_NOTE_COUNT(result_root))
                 
                 # Compare counts to identify loss
-                if len(source_notes) > len(result_notes):
-                    lost_count = len(source_notes) - len(result_notes)
+                if source_note_count > result_note_count:
+                    lost_count = source_note_count - result_note_count
                     lost_elements.append({
                         "element": "musical events",
                         "count": lost_count,
                         "location": "throughout document"
                     })
                 
-                # Compare metadata
+                # Compare metadata; an element without text matches an empty string
                 source_metadata = self._extract_metadata_from_json(json_source)
                 result_metadata = self._extract_metadata(result_root, conversion_type.split('_to_')[1])
                 
@@ -946,7 +1442,7 @@ class ConversionEvaluator:
                             "element": "metadata",
                             "value": value
                         })
-                    elif result_metadata[key] != value:
+                    elif (result_metadata[key] or '') != (value or ''):
                         modified_content.append({
                             "element": f"metadata.{key}",
                             "original": value,
@@ -955,118 +1451,82 @@ class ConversionEvaluator:
             
             else:
                 # XML to XML conversion
-                source_root = etree.fromstring(source.encode('utf-8'))
-                result_root = etree.fromstring(result.encode('utf-8'))
+                source_root = self._parse_document(source)
+                result_root = self._parse_document(result)
 
                 # Get mappings and analyze element loss with more tolerance
                 mappings = self.element_mappings.get(conversion_type, {})
                 
-                # Create sets of important source tags to check
+                # Tags checked for loss, attribute changes and content changes
                 important_tags = {'note', 'rest', 'chord', 'measure', 'staff'}
+                loss_tags = important_tags | {'clef', 'key', 'time'}
+                note_tags = {'note', 'rest', 'chord'}
+                attr_mappings = self.attribute_mappings.get(conversion_type, {})
+                
+                # One pass over mapped tags, then important tags without a mapping
+                source_tags = list(mappings)
+                source_tags.extend(tag for tag in ('note', 'rest', 'chord', 'measure', 'staff')
+                                   if tag not in mappings)
+                
+                # Group just those elements by tag once instead of scanning per tag
+                source_buckets = self._bucket_by_tag(source_root, set(source_tags))
+                result_buckets = self._bucket_by_tag(
+                    result_root,
+                    self._target_tags([mappings.get(tag, tag) for tag in source_tags], conversion_type)
+                )
                 
-                for source_tag, target_tag in mappings.items():
-                    # Skip less important elements for data loss report
-                    if source_tag not in important_tags and source_tag not in {'clef', 'key', 'time'}:
-                        continue
-                    
-                    # Get source elements
-                    source_elements = source_root.xpath(f'//{source_tag}')
-                    
-                    # Get target elements with namespace handling
-                    if conversion_type.endswith('_to_mei'):
-                        target_elements = result_root.xpath(f'//mei:{target_tag}', 
-                                                         namespaces={'mei': 'http://www.music-encoding.org/ns/mei'})
-                        if not target_elements:  # Try without namespace
-                            target_elements = result_root.xpath(f'//{target_tag}')
-                    else:
-                        target_elements = result_root.xpath(f'//{target_tag}')
-                    
-                    # Calculate significant loss (more than 10% difference)
-                    if len(source_elements) > 0 and (len(source_elements) - len(target_elements)) > max(1, len(source_elements) * 0.1):
-                        lost_count = len(source_elements) - len(target_elements)
-                        lost_elements.append({
-                            "element": source_tag,
-                            "count": lost_count,
-                            "location": "throughout document"
-                        })
-                
-                # Compare important attributes for frequently used elements
-                for source_tag in important_tags:
+                for source_tag in source_tags:
                     target_tag = mappings.get(source_tag, source_tag)
                     
                     # Get source elements
-                    source_elements = source_root.xpath(f'//{source_tag}')
+                    source_elements = source_buckets.get(source_tag, [])
                     
                     # Get target elements with namespace handling
-                    if conversion_type.endswith('_to_mei'):
-                        target_elements = result_root.xpath(f'//mei:{target_tag}', 
-                                                         namespaces={'mei': 'http://www.music-encoding.org/ns/mei'})
-                        if not target_elements:  # Try without namespace
-                            target_elements = result_root.xpath(f'//{target_tag}')
-                    else:
-                        target_elements = result_root.xpath(f'//{target_tag}')
-                    
-                    # Check attributes for the first few elements
-                    max_to_check = min(5, min(len(source_elements), len(target_elements)))
-                    for i in range(max_to_check):
-                        s_elem = source_elements[i]
-                        t_elem = target_elements[i]
-                        
-                        # Get attributes with mapping
-                        attr_mappings = self.attribute_mappings.get(conversion_type, {})
-                        
-                        for s_attr, s_value in s_elem.attrib.items():
-                            # Find target attribute name
-                            t_attr = s_attr
-                            if s_attr in attr_mappings:
-                                t_attr = attr_mappings[s_attr]
-                                if isinstance(t_attr, list):
-                                    # Split attributes like pitch to pname+oct
-                                    continue  # Skip these for now
-                            
-                            # Check if attribute exists in target
-                            if t_attr not in t_elem.attrib and s_attr in ['pitch', 'duration', 'pname', 'oct', 'dur']:
-                                lost_attributes.append({
-                                    "attribute": s_attr,
-                                    "element": self._get_element_context(s_elem),
-                                    "value": s_value
-                                })
-                
-                # Check for significant content modifications
-                note_tags = ['note', 'rest', 'chord']
-                for source_tag in note_tags:
-                    target_tag = mappings.get(source_tag, source_tag)
+                    target_elements = self._target_elements(result_buckets, target_tag, conversion_type)
                     
-                    # Get source elements
-                    source_elements = source_root.xpath(f'//{source_tag}')
+                    # Calculate significant loss (more than 10% difference) for mapped tags
+                    if source_tag in mappings and source_tag in loss_tags:
+                        if len(source_elements) > 0 and (len(source_elements) - len(target_elements)) > max(1, len(source_elements) * 0.1):
+                            lost_count = len(source_elements) - len(target_elements)
+                            lost_elements.append({
+                                "element": source_tag,
+                                "count": lost_count,
+                                "location": "throughout document"
+                            })
                     
-                    # Get target elements with namespace handling
-                    if conversion_type.endswith('_to_mei'):
-                        target_elements = result_root.xpath(f'//mei:{target_tag}', 
-                                                         namespaces={'mei': 'http://www.music-encoding.org/ns/mei'})
-                        if not target_elements:  # Try without namespace
-                            target_elements = result_root.xpath(f'//{target_tag}')
-                    else:
-                        target_elements = result_root.xpath(f'//{target_tag}')
+                    # Compare important attributes for the first few elements
+                    if source_tag in important_tags:
+                        for s_elem, t_elem in islice(zip(source_elements, target_elements), 5):
+                            for s_attr, s_value in s_elem.attrib.items():
+                                # Find target attribute name
+                                t_attr = s_attr
+                                if s_attr in attr_mappings:
+                                    t_attr = attr_mappings[s_attr]
+                                    if isinstance(t_attr, tuple):
+                                        # Split attributes like pitch to pname+oct
+                                        continue  # Skip these for now
+                                
+                                # Check if attribute exists in target
+                                if t_attr not in t_elem.attrib and s_attr in _IMPORTANT_LOSS_ATTRIBUTES:
+                                    lost_attributes.append({
+                                        "attribute": s_attr,
+                                        "element": self._get_element_context(s_elem),
+                                        "value": s_value
+                                    })
                     
-                    # Check content modifications for the first few elements
-                    max_to_check = min(10, min(len(source_elements), len(target_elements)))
-                    for i in range(max_to_check):
-                        s_elem = source_elements[i]
-                        t_elem = target_elements[i]
-                        
-                        # Check for text content changes
-                        if s_elem.text and t_elem.text and s_elem.text.strip() != t_elem.text.strip():
-                            modified_content.append({
-                                "element": f"{source_tag} {i+1}",
-                                "original": s_elem.text.strip(),
-                                "modified": t_elem.text.strip()
-                            })
+                    # Check content modifications for the first few notes, rests and chords
+                    if source_tag in note_tags:
+                        pairs = islice(zip(source_elements, target_elements), 10)
+                        for i, (s_elem, t_elem) in enumerate(pairs):
+                            # Check for text content changes
+                            if s_elem.text and t_elem.text and s_elem.text.strip() != t_elem.text.strip():
+                                modified_content.append({
+                                    "element": f"{source_tag} {i+1}",
+                                    "original": s_elem.text.strip(),
+                                    "modified": t_elem.text.strip()
+                                })
 
-            # Analyze format-specific features
-            if not conversion_type.startswith('json_to_') and not conversion_type.endswith('_to_json'):
-                source_root = etree.fromstring(source.encode('utf-8'))
-                result_root = etree.fromstring(result.encode('utf-8'))
+                # Analyze format-specific features on the trees parsed above
                 context['format_specific'] = self._analyze_format_features(
                     source_root, result_root, conversion_type
                 )
@@ -1076,18 +1536,22 @@ class ConversionEvaluator:
                     source_root, result_root
                 )
 
+            # Summarize the losses once for severity and the report consumers
+            summary = self._summarize_loss(lost_elements, lost_attributes)
+
             # Determine severity with improved logic
             severity = self._determine_loss_severity(
-                lost_elements, lost_attributes, modified_content, conversion_type
+                lost_elements, lost_attributes, modified_content, conversion_type, summary
             )
 
             report = DataLossReport(
                 lost_elements=lost_elements,
                 lost_attributes=lost_attributes,
                 modified_content=modified_content,
-                context=dict(context),
+                context=context,
                 timestamp=datetime.now().isoformat(),
-                severity=severity
+                severity=severity,
+                summary=summary
             )
 
             # Save report if directory is configured
@@ -1141,9 +1605,9 @@ class ConversionEvaluator:
             },
             "data_loss_details": {
                 "severity": loss_report.severity,
-                "lost_elements": self._format_lost_elements(loss_report.lost_elements),
-                "lost_attributes": self._format_lost_attributes(loss_report.lost_attributes),
-                "modified_content": self._format_modifications(loss_report.modified_content)
+                "lost_elements": loss_report.lost_elements,
+                "lost_attributes": loss_report.lost_attributes,
+                "modified_content": loss_report.modified_content
             },
             "validation": {
                 "errors": metrics.validation_errors,
@@ -1155,7 +1619,8 @@ class ConversionEvaluator:
 
     def _compare_elements(self, source_elem: etree._Element, 
                          target_elem: etree._Element, 
-                         conversion_type: str) -> bool:
+                         conversion_type: str,
+                         attr_mappings: Optional[Dict[str, Any]] = None) -> bool:
         """
         Compare two elements for meaningful modifications.
         Returns True if elements are significantly different.
@@ -1164,85 +1629,69 @@ class ConversionEvaluator:
             source_elem: Source element
             target_elem: Target element
             conversion_type: Type of conversion
+            attr_mappings: Attribute mappings for the conversion, looked up
+                when not given; callers comparing many pairs pass it once
             
         Returns:
             bool: True if elements are significantly different
         """
-        # Get source and target attribute dictionaries
-        source_attrs = dict(source_elem.attrib)
-        target_attrs = dict(target_elem.attrib)
-        
         # Get attribute mappings for this conversion
-        attr_mappings = self.attribute_mappings.get(conversion_type, {})
-        
-        # Check important attributes first
-        important_attrs = ['pitch', 'duration', 'pname', 'oct', 'dur', 'accidental', 'accid']
-        
-        # Track significant differences
-        significant_diff = False
-        
-        # Compare important source attributes to their mapped target attributes
-        for s_attr in important_attrs:
-            if s_attr not in source_attrs:
+        if attr_mappings is None:
+            attr_mappings = self.attribute_mappings.get(conversion_type, {})
+        to_mei = conversion_type.endswith('_to_mei')
+        
+        # Compare important source attributes to their mapped target attributes,
+        # reading attributes straight from the elements instead of copying them.
+        # The first significant difference decides the result.
+        for s_attr, s_value in source_elem.items():
+            if s_attr not in _IMPORTANT_ATTRIBUTES:
                 continue
-                
-            s_value = source_attrs[s_attr]
             
             # Get target attribute name(s)
             if s_attr in attr_mappings:
                 t_attr = attr_mappings[s_attr]
                 
                 # Handle special case of pitch to pname+oct in MEI
-                if s_attr == 'pitch' and isinstance(t_attr, list) and conversion_type.endswith('_to_mei'):
+                if s_attr == 'pitch' and isinstance(t_attr, tuple) and to_mei:
                     # Extract pname and oct from pitch (e.g., "C4" -> pname="c", oct="4")
-                    match = re.match(r'^([A-G])([#b])?(\d+)$', s_value)
+                    match = _PITCH_RE.match(s_value)
                     
                     if match:
                         pname, accid, oct = match.groups()
                         
                         # Check if pname and oct are correct in target
-                        pname_match = target_attrs.get('pname', '').upper() == pname
-                        oct_match = target_attrs.get('oct') == oct
+                        pname_match = target_elem.get('pname', '').upper() == pname
+                        oct_match = target_elem.get('oct') == oct
                         
                         # Check accidental if present
-                        accid_match = True
-                        if accid:
-                            target_accid = target_attrs.get('accid')
-                            if (accid == '#' and target_accid != 's') or (accid == 'b' and target_accid != 'f'):
-                                accid_match = False
+                        accid_match = not accid or target_elem.get('accid') == _ACCID_MAP[accid]
                         
                         if not (pname_match and oct_match and accid_match):
-                            significant_diff = True
+                            return True
                     
                 # Handle other mappings
                 elif isinstance(t_attr, str):
-                    if t_attr not in target_attrs or target_attrs[t_attr] != s_value:
+                    t_value = target_elem.get(t_attr)
+                    if t_value != s_value:
                         # Allow for format-specific conversion differences
                         if s_attr == 'duration' and t_attr == 'dur':
                             # Map between duration values
-                            duration_map = {
-                                'whole': '1', 'half': '2', 'quarter': '4',
-                                'eighth': '8', 'sixteenth': '16', '32nd': '32',
-                                'maxima': 'maxima', 'longa': 'long', 'brevis': 'breve'
-                            }
-                            
-                            if s_value in duration_map and target_attrs.get(t_attr) == duration_map.get(s_value):
+                            if s_value in _DURATION_MAP and t_value == _DURATION_MAP[s_value]:
                                 # Duration is mapped correctly
                                 continue
                         
-                        significant_diff = True
+                        return True
             
             # If no mapping exists, check for direct correspondence
-            elif s_attr in target_attrs and target_attrs[s_attr] != s_value:
-                significant_diff = True
+            else:
+                t_value = target_elem.get(s_attr)
+                if t_value is not None and t_value != s_value:
+                    return True
         
         # Check if text content differs significantly (if both have non-empty text)
-        if (source_elem.text and source_elem.text.strip() and 
-            target_elem.text and target_elem.text.strip() and
-            source_elem.text.strip() != target_elem.text.strip()):
-            significant_diff = True
-            
-        return significant_diff
+        source_text = source_elem.text.strip() if source_elem.text else ''
+        target_text = target_elem.text.strip() if target_elem.text else ''
+        return bool(source_text and target_text and source_text != target_text)
 
     def _evaluate_metadata_preservation(self, source_root: etree._Element, 
                                      result_root: etree._Element,
@@ -1272,28 +1721,28 @@ class ConversionEvaluator:
             preserved = 0
             total = len(source_metadata)
             
+            # Index result values by lowercased key; the first key wins, as in
+            # a scan of the result items
+            result_by_key = {}
+            for res_key, res_value in result_metadata.items():
+                result_by_key.setdefault(res_key.lower(), res_value)
+            
             for src_key, src_value in source_metadata.items():
+                src_key = src_key.lower()
+                
                 # Look for matching key in result metadata (case-insensitive)
-                found = False
-                for res_key, res_value in result_metadata.items():
-                    if src_key.lower() == res_key.lower():
-                        # Check if values match (case-insensitive)
-                        if src_value and res_value and src_value.lower() == res_value.lower():
-                            preserved += 1
-                        # Count as partial match if the value exists but differs
-                        elif src_value and res_value:
-                            preserved += 0.5
-                        found = True
-                        break
+                if src_key in result_by_key:
+                    res_value = result_by_key[src_key]
+                    # Check if values match (case-insensitive)
+                    if src_value and res_value and src_value.lower() == res_value.lower():
+                        preserved += 1
+                    # Count as partial match if the value exists but differs
+                    elif src_value and res_value:
+                        preserved += 0.5
                 
                 # If key wasn't found, check if a similar key exists
-                if not found:
-                    for res_key in result_metadata:
-                        # Check for key similarity
-                        if (src_key.lower() in res_key.lower() or 
-                            res_key.lower() in src_key.lower()):
-                            preserved += 0.3  # Partial credit for similar key
-                            break
+                elif any(src_key in res_key or res_key in src_key for res_key in result_by_key):
+                    preserved += 0.3  # Partial credit for similar key
             
             return preserved / total
         except Exception as e:
@@ -1319,9 +1768,8 @@ class ConversionEvaluator:
             source_structure = self._get_structure(source_root)
             result_structure = self._get_structure(result_root)
             
-            # Calculate similarity ratio
-            matcher = difflib.SequenceMatcher(None, source_structure, result_structure)
-            similarity = matcher.ratio()
+            # Calculate similarity ratio from the longest common subsequence
+            similarity = _indel_similarity(source_structure, result_structure)
             
             # For conversions between different formats, we expect structural changes
             # So we adjust the score to be more forgiving
@@ -1333,32 +1781,15 @@ class ConversionEvaluator:
                 source_format = conversion_type.split('_to_')[0]
                 target_format = conversion_type.split('_to_')[1]
                 
-                # Count musical elements in source and result
-                musical_elements = ['note', 'rest', 'chord', 'measure']
-                
-                source_counts = {}
-                result_counts = {}
-                
-                for elem in musical_elements:
-                    if source_format == 'mei':
-                        source_counts[elem] = len(source_root.xpath(f'//mei:{elem}', 
-                                               namespaces={'mei': 'http://www.music-encoding.org/ns/mei'}))
-                    else:
-                        source_counts[elem] = len(source_root.xpath(f'//{elem}'))
-                        
-                    if target_format == 'mei':
-                        result_counts[elem] = len(result_root.xpath(f'//mei:{elem}', 
-                                               namespaces={'mei': 'http://www.music-encoding.org/ns/mei'}))
-                    else:
-                        result_counts[elem] = len(result_root.xpath(f'//{elem}'))
-                
-                # Calculate average element preservation ratio
+                # Calculate average element preservation ratio, counting the
+                # result only for elements the source has; a source without
+                # musical elements leaves the result uncounted
                 preservation_ratios = []
-                for elem in musical_elements:
-                    src_count = source_counts.get(elem, 0)
-                    res_count = result_counts.get(elem, 0)
-                    
+                for source_count, result_count in zip(_STRUCTURE_COUNTS[source_format],
+                                                      _STRUCTURE_COUNTS[target_format]):
+                    src_count = int(source_count(source_root))
                     if src_count > 0:
+                        res_count = int(result_count(result_root))
                         ratio = min(1.0, res_count / src_count)
                         preservation_ratios.append(ratio)
                 
@@ -1372,13 +1803,16 @@ class ConversionEvaluator:
             self.logger.warning(f"Error evaluating structural integrity: {str(e)}")
             return 0.7  # Default to reasonable score on error
 
-    def _validate_result(self, result: str, conversion_type: str) -> List[str]:
+    def _validate_result(self, result: str, conversion_type: str,
+                         parsed: Any = None) -> List[str]:
         """
         Validate the conversion result.
         
         Args:
             result: Result content
             conversion_type: Conversion type
+            parsed: Already decoded JSON data or parsed XML root of the result,
+                so the syntax check does not parse it again
             
         Returns:
             List[str]: Validation errors
@@ -1390,10 +1824,7 @@ class ConversionEvaluator:
             if conversion_type.endswith('_to_json'):
                 try:
                     # Parse JSON to validate syntax
-                    if isinstance(result, str):
-                        data = json.loads(result)
-                    else:
-                        data = result
+                    data = parsed if parsed is not None else self._load_json(result)
                     
                     # Check basic JSON structure
                     if not isinstance(data, dict):
@@ -1409,13 +1840,14 @@ class ConversionEvaluator:
                 # XML validation
                 try:
                     # Parse XML to validate syntax
-                    root = etree.fromstring(result.encode('utf-8'))
+                    if parsed is None:
+                        parsed = self._parse_document(result)
                     
-                    # Format-specific validation
+                    # Format-specific validation on the parsed tree
                     if conversion_type.endswith('_to_mei'):
-                        errors.extend(self._validate_mei(result))
+                        errors.extend(self._validate_mei(result, parsed))
                     elif conversion_type.endswith('_to_cmme'):
-                        errors.extend(self._validate_cmme(result))
+                        errors.extend(self._validate_cmme(result, parsed))
                     
                 except etree.ParseError as e:
                     errors.append(f"Invalid XML syntax: {str(e)}")
@@ -1426,11 +1858,14 @@ class ConversionEvaluator:
 
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
+        if psutil is None:
+            return 0.0
         try:
-            import psutil
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss / 1024 / 1024
-        except (ImportError, Exception):
+            # Reuse the handle unless the evaluator now lives in a forked child
+            if self._process is None or self._process.pid != os.getpid():
+                self._process = psutil.Process(os.getpid())
+            return self._process.memory_info().rss / 1024 / 1024
+        except Exception:
             return 0.0
 
     def _save_evaluation_report(self, metrics: ConversionMetrics, 
@@ -1439,25 +1874,12 @@ class ConversionEvaluator:
         if not self.report_dir:
             return
             
-        filename = f"evaluation_{conversion_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = self._report_filename('evaluation', conversion_type)
         filepath = os.path.join(self.report_dir, filename)
         
         try:
-            with open(filepath, 'w') as f:
-                # Handle non-serializable metrics
-                report_data = {
-                    'total_elements': metrics.total_elements,
-                    'preserved_elements': metrics.preserved_elements,
-                    'lost_elements': metrics.lost_elements,
-                    'modified_elements': metrics.modified_elements,
-                    'accuracy_score': metrics.accuracy_score,
-                    'metadata_preservation': metrics.metadata_preservation,
-                    'structural_integrity': metrics.structural_integrity,
-                    'validation_errors': metrics.validation_errors,
-                    'conversion_time': metrics.conversion_time,
-                    'memory_usage': metrics.memory_usage
-                }
-                json.dump(report_data, f, indent=2)
+            # Every metrics field is saved as is
+            self._queue_report(filepath, metrics)
         except Exception as e:
             self.logger.error(f"Error saving evaluation report: {str(e)}")
 
@@ -1466,86 +1888,167 @@ class ConversionEvaluator:
         if not self.report_dir:
             return
             
-        filename = f"loss_report_{conversion_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = self._report_filename('loss_report', conversion_type)
         filepath = os.path.join(self.report_dir, filename)
         
         try:
-            with open(filepath, 'w') as f:
-                # Convert to dict for JSON serialization
-                report_data = {
-                    'lost_elements': report.lost_elements,
-                    'lost_attributes': report.lost_attributes,
-                    'modified_content': report.modified_content,
-                    'context': report.context,
-                    'timestamp': report.timestamp,
-                    'severity': report.severity
-                }
-                json.dump(report_data, f, indent=2)
+            # Convert to dict for JSON serialization, leaving out the in-memory summary
+            report_data = {
+                'lost_elements': report.lost_elements,
+                'lost_attributes': report.lost_attributes,
+                'modified_content': report.modified_content,
+                'context': report.context,
+                'timestamp': report.timestamp,
+                'severity': report.severity
+            }
+            self._queue_report(filepath, report_data)
         except Exception as e:
             self.logger.error(f"Error saving loss report: {str(e)}")
 
-    def _determine_loss_severity(self, lost_elements: List[Dict[str, str]],
-                               lost_attributes: List[Dict[str, str]],
-                               modified_content: List[Dict[str, Any]],
-                               conversion_type: str = None) -> str:
+    def _report_filename(self, kind: str, conversion_type: str) -> str:
+        """Build a unique report file name stamped with the current second."""
+        second = int(time.time())
+        if second != self._report_second:
+            self._report_stamp = datetime.fromtimestamp(second).strftime('%Y%m%d_%H%M%S')
+            self._report_second = second
+        return f"{kind}_{conversion_type}_{self._report_stamp}_{next(self._report_sequence)}.json"
+
+    def _queue_report(self, filepath: str, report_data: Any) -> None:
         """
-        Determine the severity of data loss with better context awareness.
+        Serialize a report as indented JSON and hand it to the writer thread.
+
+        The report is serialized right away, with orjson when available, so
+        later changes to the reported objects do not reach the file.
+
+        Args:
+            filepath (str): Destination of the report
+            report_data (Any): JSON-serializable dict, or a dataclass whose
+                fields are saved; orjson serializes dataclasses natively
+        """
+        if orjson is not None:
+            blob = orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            if not isinstance(report_data, dict):
+                report_data = asdict(report_data)
+            blob = json.dumps(report_data, indent=2).encode('utf-8')
+        
+        with self._report_writer_lock:
+            if self._report_writer is None:
+                self._start_report_writer()
+        self._report_queue.put((filepath, blob))
+
+    def _start_report_writer(self):
+        """Start the background thread writing queued reports to disk."""
+        def worker():
+            while True:
+                filepath, blob = self._report_queue.get()
+                try:
+                    # Reports are already serialized, so write them with raw
+                    # descriptor calls instead of a buffered file object
+                    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        view = memoryview(blob)
+                        while view:
+                            view = view[os.write(fd, view):]
+                    finally:
+                        os.close(fd)
+                except Exception as e:
+                    self.logger.error(f"Error writing report {filepath}: {str(e)}")
+                finally:
+                    self._report_queue.task_done()
+        
+        self._report_writer = threading.Thread(target=worker, daemon=True)
+        self._report_writer.start()
+        
+        # The writer is a daemon thread, so write out what is queued at exit
+        atexit.register(self.flush_reports)
+
+    def flush_reports(self) -> None:
+        """Block until every queued report has been written."""
+        self._report_queue.join()
+
+    def _summarize_loss(self, lost_elements: List[Dict[str, str]],
+                        lost_attributes: List[Dict[str, str]]) -> LossSummary:
+        """
+        Count lost elements and attributes in one pass over each list.
         
         Args:
             lost_elements: List of lost elements
             lost_attributes: List of lost attributes
-            modified_content: List of modified content
-            conversion_type: Conversion type for context
             
         Returns:
-            str: Severity level ("none", "low", "medium", "high")
+            LossSummary: Totals, musical element and important attribute counts,
+                and the names of the lost elements and attributes
         """
-        # Count total issues
-        total_elements = sum(elem.get('count', 1) for elem in lost_elements)
-        
-        # Count lost musical elements (notes, rests, chords)
+        # Count total issues and lost musical elements (notes, rests, chords)
+        total_elements = 0
         musical_elements = 0
+        element_names = set()
         for elem in lost_elements:
-            element_type = elem.get('element', '')
             count = elem.get('count', 1)
-            if element_type in ['note', 'notes', 'rest', 'rests', 'chord', 'chords']:
+            element_type = elem.get('element', '')
+            total_elements += count
+            element_names.add(element_type)
+            if element_type in _MUSICAL_LOSS_ELEMENTS:
                 musical_elements += count
         
         # Count important attributes (pitch, duration)
+        attr_names = set()
         important_attrs = 0
         for attr in lost_attributes:
             attr_name = attr.get('attribute', '')
-            if attr_name in ['pitch', 'duration', 'pname', 'oct', 'dur']:
+            attr_names.add(attr_name)
+            if attr_name in _IMPORTANT_LOSS_ATTRIBUTES:
                 important_attrs += 1
         
+        return LossSummary(
+            total_elements=total_elements,
+            musical_elements=musical_elements,
+            important_attrs=important_attrs,
+            element_names=frozenset(element_names),
+            attr_names=frozenset(attr_names)
+        )
+
+    def _determine_loss_severity(self, lost_elements: List[Dict[str, str]],
+                               lost_attributes: List[Dict[str, str]],
+                               modified_content: List[Dict[str, Any]],
+                               conversion_type: str = None,
+                               summary: Optional[LossSummary] = None) -> str:
+        """
+        Determine the severity of data loss with better context awareness.
+        
+        Args:
+            lost_elements: List of lost elements
+            lost_attributes: List of lost attributes
+            modified_content: List of modified content
+            conversion_type: Conversion type for context
+            summary: Summary of the lost elements and attributes, computed
+                when not given
+            
+        Returns:
+            str: Severity level ("none", "low", "medium", "high")
+        """
+        if summary is None:
+            summary = self._summarize_loss(lost_elements, lost_attributes)
+        total_elements = summary.total_elements
+        musical_elements = summary.musical_elements
+        important_attrs = summary.important_attrs
+        
         # For cross-format conversions, be more forgiving
-        if conversion_type in ['cmme_to_mei', 'mei_to_cmme', 'cmme_to_json', 'mei_to_json']:
+        if conversion_type in _CROSS_FORMAT_CONVERSIONS:
             # Structural differences are expected, focus on musical content
-            if musical_elements > 10:
-                return "high"
-            elif musical_elements > 5 or important_attrs > 10:
-                return "medium"
-            elif musical_elements > 0 or important_attrs > 3:
-                return "low"
-            else:
-                return "none"
-        
+            level = max(bisect_left(_CROSS_FORMAT_MUSICAL_BANDS, musical_elements),
+                        bisect_left(_CROSS_FORMAT_ATTRIBUTE_BANDS, important_attrs))
         # Standard severity calculation (more strict)
-        if total_elements == 0 and len(lost_attributes) == 0 and len(modified_content) == 0:
-            return "none"
+        elif total_elements == 0 and len(lost_attributes) == 0 and len(modified_content) == 0:
+            level = 0
         elif musical_elements > 0 or important_attrs > 0:
-            if musical_elements > 5 or important_attrs > 5:
-                return "high"
-            elif musical_elements > 0 or important_attrs > 2:
-                return "medium"
-            else:
-                return "low"
-        elif total_elements > 10 or len(lost_attributes) > 20:
-            return "high"
-        elif total_elements > 5 or len(lost_attributes) > 10:
-            return "medium"
+            level = max(bisect_left(_MUSICAL_BANDS, musical_elements),
+                        bisect_left(_IMPORTANT_ATTRIBUTE_BANDS, important_attrs))
         else:
-            return "low"
+            level = 1 + max(bisect_left(_STRUCTURAL_ELEMENT_BANDS, total_elements),
+                            bisect_left(_STRUCTURAL_ATTRIBUTE_BANDS, len(lost_attributes)))
+        return _SEVERITY_LEVELS[level]
 
     def _get_element_context(self, elem: etree._Element) -> str:
         """
@@ -1558,23 +2061,18 @@ class ConversionEvaluator:
             str: Context information string
         """
         try:
-            # Try to get element path
-            path = self._get_element_path(elem) if hasattr(self, '_get_element_path') else ""
-            
             # Get element name
-            name = elem.tag
-            if '}' in name:
-                name = name.split('}', 1)[1]  # Remove namespace
+            name = elem.tag.rpartition('}')[2]  # Remove namespace
                 
             # Get attributes if any
             attrs = ""
-            if elem.attrib:
-                attrs = " " + " ".join([f'{k}="{v}"' for k, v in elem.attrib.items()])
+            if len(elem.attrib):
+                attrs = " " + " ".join(f'{k}="{v}"' for k, v in elem.items())
                 
             # Get text if any
-            text = ""
-            if elem.text and elem.text.strip():
-                text = f" | text: {elem.text.strip()}"
+            text = (elem.text or '').strip()
+            if text:
+                text = f" | text: {text}"
                 
             return f"{name}{attrs}{text}"
         except Exception as e:
@@ -1592,17 +2090,19 @@ class ConversionEvaluator:
         """
         path_parts = []
         current = element
-        while current is not None:
-            if current.getparent() is not None:
-                siblings = current.getparent().findall(current.tag)
-                if len(siblings) > 1:
-                    index = siblings.index(current) + 1
-                    path_parts.append(f"{current.tag}[{index}]")
-                else:
-                    path_parts.append(current.tag)
+        parent = current.getparent()
+        while parent is not None:
+            # Position among same-tag siblings, counted from the neighbours
+            # instead of collecting every sibling at each level
+            tag = current.tag
+            index = sum(1 for _ in current.itersiblings(tag, preceding=True)) + 1
+            if index > 1 or next(current.itersiblings(tag), None) is not None:
+                path_parts.append(f"{tag}[{index}]")
             else:
-                path_parts.append(current.tag)
-            current = current.getparent()
+                path_parts.append(tag)
+            current = parent
+            parent = current.getparent()
+        path_parts.append(current.tag)
         return '/' + '/'.join(reversed(path_parts))
 
     def _get_xpath(self, element_context: str) -> str:
@@ -1634,18 +2134,6 @@ class ConversionEvaluator:
         parts = attribute.split('@', 1)
         return parts[0] if len(parts) > 1 else "Unknown element"
 
-    def _format_lost_elements(self, lost_elements: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Format lost elements for reporting."""
-        return lost_elements
-
-    def _format_lost_attributes(self, lost_attributes: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Format lost attributes for reporting."""
-        return lost_attributes
-
-    def _format_modifications(self, modified_content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Format modifications for reporting."""
-        return modified_content
-
     def _generate_warnings(self, metrics: ConversionMetrics, 
                          loss_report: DataLossReport) -> List[str]:
         """
@@ -1701,19 +2189,17 @@ class ConversionEvaluator:
         if metrics.metadata_preservation < 0.9:
             recommendations.append("Review and update metadata fields in the converted document")
         
-        # Add recommendations based on loss report
-        musical_elements_lost = any(
-            elem.get('element') in ['note', 'rest', 'chord'] 
-            for elem in loss_report.lost_elements
-        )
+        # Add recommendations based on loss report, reading the summary built
+        # with the report when there is one
+        summary = getattr(loss_report, 'summary', None)
+        if summary is None:
+            summary = self._summarize_loss(loss_report.lost_elements, loss_report.lost_attributes)
         
-        if musical_elements_lost:
+        if summary.element_names & _REVIEW_ELEMENTS:
             recommendations.append("Check for missing notes, rests, or chords in the converted document")
         
-        if loss_report.lost_attributes:
-            attr_names = {attr.get('attribute') for attr in loss_report.lost_attributes}
-            if 'pitch' in attr_names or 'pname' in attr_names or 'duration' in attr_names or 'dur' in attr_names:
-                recommendations.append("Review pitch or duration information that may have been lost in conversion")
+        if summary.attr_names & _REVIEW_ATTRIBUTES:
+            recommendations.append("Review pitch or duration information that may have been lost in conversion")
             
         if metrics.validation_errors:
             recommendations.append("Address validation errors before using the converted document")
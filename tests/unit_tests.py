@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch, MagicMock
 import os
 import sys
 import json
+import tempfile
 from lxml import etree
 from io import StringIO
 
@@ -17,7 +18,7 @@ from backend.json_converter import JSONConverter
 from backend.serializer import Serializer
 from backend.transformer import Transformer
 from backend.dataset import Dataset
-from backend.evaluation import ConversionEvaluator
+from backend.evaluation import ConversionEvaluator, _indel_similarity
 
 class TestBaseTransformer(unittest.TestCase):
     """Tests for the BaseTransformer class."""
@@ -111,6 +112,24 @@ class TestBaseTransformer(unittest.TestCase):
         self.assertIn('child', path)
         self.assertIn('grandchild', path)
 
+    def test_get_element_path_indexes_repeated_tags(self):
+        """Test that only tags repeated among siblings get a position."""
+        root = etree.fromstring('<root><a/><b/><a><c/></a></root>')
+        c = root[2][0]
+        
+        self.assertEqual(self.transformer._get_element_path(c), '/root/a[2]/c')
+        self.assertEqual(self.transformer._get_element_path(root[1]), '/root/b')
+        self.assertEqual(self.transformer._get_element_path(root), '/root')
+
+    def test_schema_compiled_once(self):
+        """Test that transformers loading the same schema share it."""
+        schema_path = os.path.join(os.path.dirname(__file__), 'mock_schema.xsd')
+        first = CMMEParser(schema_path)
+        second = MEIParser(schema_path)
+
+        self.assertTrue(first.has_schema())
+        self.assertIs(first.schema, second.schema)
+
 
 class TestCMMEParser(unittest.TestCase):
     """Tests for the CMMEParser class."""
@@ -158,7 +177,42 @@ class TestCMMEParser(unittest.TestCase):
         # Should raise exception for missing duration attribute
         with self.assertRaises(ValueError):
             self.parser.validate(self.invalid_cmme)
-    
+
+    def test_validate_stream(self):
+        """Test incremental validation from a file-like source."""
+        from io import BytesIO
+
+        self.parser.validate(source=BytesIO(self.valid_cmme.encode('utf-8')))
+
+        with self.assertRaises(ValueError):
+            self.parser.validate(source=BytesIO(self.invalid_cmme.encode('utf-8')))
+
+        # Truncated documents are reported as XML errors
+        with self.assertRaises(ValueError):
+            self.parser.validate(source=BytesIO(self.valid_cmme.encode('utf-8')[:-20]))
+
+        with self.assertRaises(ValueError):
+            self.parser.validate()
+
+    def test_stream_notes_releases_finished_elements(self):
+        """Test that streamed notes and finished measures are removed from the tree."""
+        from io import BytesIO
+
+        measures = ''.join(
+            f'<measure n="{n}"><note pitch="C4" duration="brevis"/>'
+            f'<note pitch="D4" duration="brevis"/></measure>'
+            for n in range(1, 6)
+        )
+        xml = f'<cmme><staff>{measures}</staff></cmme>'.encode('utf-8')
+
+        count = 0
+        for note in self.parser._stream_notes(BytesIO(xml), chunk_size=16):
+            measure = note.getparent()
+            self.assertIsNone(note.getprevious())
+            self.assertIsNone(measure.getprevious())
+            count += 1
+        self.assertEqual(count, 10)
+
     def test_parse(self):
         """Test parsing CMME XML into note elements."""
         notes = self.parser.parse(self.valid_cmme)
@@ -221,6 +275,43 @@ class TestCMMEParser(unittest.TestCase):
         self.assertIsNotNone(coloration)
         self.assertEqual(coloration.get("type"), "blackened")
 
+    def test_create_note_pitch_formats(self):
+        """Test standard, musica ficta and letter-only pitch formats."""
+        for pitch in ("C4", "D#3", "Bb2", "C.4", "G", "Bb"):
+            self.assertEqual(self.parser.create_note(pitch, "brevis").get("pitch"), pitch)
+
+        for pitch in ("H4", "C44", "c4", "C#b4", ""):
+            with self.assertRaises(ValueError):
+                self.parser.create_note(pitch, "brevis")
+
+    def test_parse_extended_repeated_notes(self):
+        """Test that repeated identical notes parse to independent dicts."""
+        xml = """<cmme><score><staff name="Tenor"><measure n="1">
+            <note pitch="G3" duration="brevis"/>
+            <note pitch="G3" duration="brevis"/>
+            <note pitch="G3" duration="brevis"><ligature position="start"/></note>
+        </measure></staff></score></cmme>"""
+        contents = self.parser.parse_extended(xml)['parts'][0]['measures'][0]['contents']
+        first, second, third = [item['attributes'] for item in contents]
+
+        self.assertEqual(first, {'pitch': 'G3', 'duration': 'brevis'})
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(third['ligature']['position'], 'start')
+
+    def test_parse_extended_compact_notes(self):
+        """Test that compact notes convert back to the dict representation."""
+        xml = """<cmme><score><staff name="Tenor"><measure n="1">
+            <note pitch="G3" duration="brevis" stem-direction="up"><ligature position="end"/></note>
+            <chord><note pitch="C4" duration="minima"/><note pitch="E4" duration="minima"/></chord>
+        </measure></staff></score></cmme>"""
+        expected = self.parser.parse_extended(xml)['parts'][0]['measures'][0]['contents']
+        contents = CMMEParser(compact_notes=True).parse_extended(xml)['parts'][0]['measures'][0]['contents']
+
+        self.assertEqual(contents[0]['attributes'].stem_direction, 'up')
+        self.assertEqual(contents[0]['attributes'].asdict(), expected[0]['attributes'])
+        self.assertEqual([n.asdict() for n in contents[1]['notes']], expected[1]['notes'])
+
 
 class TestMEIParser(unittest.TestCase):
     """Tests for the MEIParser class."""
@@ -923,6 +1014,40 @@ class TestDataset(unittest.TestCase):
         self.assertIn('cmme', dataset['files'])
         self.assertIn('test.cmme', dataset['files']['cmme'])
     
+    def test_load_metadata_returns_fresh_copy(self):
+        """Test that cached metadata loads can be mutated independently."""
+        self.dataset_manager.create_dataset(self.dataset_name, self.dataset_description)
+        dataset_path = os.path.join(self.temp_dir, self.dataset_name)
+        
+        first = self.dataset_manager._load_metadata(dataset_path)
+        first['formats']['cmme'] = 99
+        second = self.dataset_manager._load_metadata(dataset_path)
+        self.assertEqual(second['formats']['cmme'], 0)
+        
+        second['description'] = 'Changed'
+        self.dataset_manager._save_metadata(dataset_path, second)
+        self.assertEqual(self.dataset_manager._load_metadata(dataset_path)['description'], 'Changed')
+        
+        dataset = self.dataset_manager.get_dataset(self.dataset_name, include_files=False)
+        self.assertNotIn('files', dataset)
+    
+    def test_save_metadata_keeps_other_datasets_cached(self):
+        """Test that saving one dataset's metadata does not drop the others from the cache."""
+        from backend.dataset import _METADATA_CACHE
+        self.dataset_manager.create_dataset('dataset1', 'Description 1')
+        self.dataset_manager.create_dataset('dataset2', 'Description 2')
+        first_path = os.path.join(self.temp_dir, 'dataset1')
+        second_path = os.path.join(self.temp_dir, 'dataset2')
+        self.dataset_manager._load_metadata(first_path)
+        second = self.dataset_manager._load_metadata(second_path)
+        
+        second['description'] = 'Changed'
+        self.dataset_manager._save_metadata(second_path, second)
+        
+        self.assertIn(os.path.join(first_path, 'metadata.json'), _METADATA_CACHE)
+        self.assertNotIn(os.path.join(second_path, 'metadata.json'), _METADATA_CACHE)
+        self.assertEqual(self.dataset_manager._load_metadata(second_path)['description'], 'Changed')
+    
     def test_list_datasets(self):
         """Test listing all datasets."""
         # Create multiple datasets
@@ -954,6 +1079,17 @@ class TestDataset(unittest.TestCase):
         # Check it's gone
         self.assertFalse(os.path.exists(dataset_path))
     
+    def test_delete_large_dataset(self):
+        """Test deleting a dataset too large for the direct unlink path."""
+        files = [
+            {'filename': f'test{i}.json', 'content': self.test_json, 'format': 'json'}
+            for i in range(self.dataset_manager.FAST_DELETE_MAX_ENTRIES)
+        ]
+        self.dataset_manager.create_dataset(self.dataset_name, self.dataset_description, files)
+        
+        self.assertTrue(self.dataset_manager.delete_dataset(self.dataset_name))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, self.dataset_name)))
+    
     def test_validate_dataset(self):
         """Test validating a dataset."""
         # Create dataset with valid files
@@ -983,6 +1119,174 @@ class TestDataset(unittest.TestCase):
         self.assertEqual(validation_results['invalid'], 0)
         self.assertEqual(len(validation_results['errors']), 0)
 
+    def test_validate_dataset_parallel(self):
+        """Test validating a dataset large enough to use the thread pool."""
+        files = [
+            {'filename': f'valid{i}.json', 'content': self.test_json, 'format': 'json'}
+            for i in range(self.dataset_manager.PARALLEL_MIN_FILES + 1)
+        ]
+        self.dataset_manager.create_dataset(self.dataset_name, self.dataset_description, files)
+        with open(os.path.join(self.temp_dir, self.dataset_name, 'json', 'broken.json'), 'w') as f:
+            f.write('{')
+        
+        validation_results = self.dataset_manager.validate_dataset(self.dataset_name)
+        
+        self.assertEqual(validation_results['valid'], len(files))
+        self.assertEqual(validation_results['invalid'], 1)
+        self.assertTrue(validation_results['errors'][0]['file'].endswith('broken.json'))
+    
+    def test_validate_dataset_parallel_schema_errors(self):
+        """Test that threads sharing a schema each report their own file's errors."""
+        schema_path = os.path.join(os.path.dirname(__file__), 'mock_schema.xsd')
+        dataset_manager = Dataset(self.temp_dir, cmme_schema=schema_path)
+        dataset_manager.create_dataset(self.dataset_name, self.dataset_description)
+        cmme_dir = os.path.join(self.temp_dir, self.dataset_name, 'cmme')
+        count = dataset_manager.PARALLEL_MIN_FILES + 1
+        for i in range(count):
+            with open(os.path.join(cmme_dir, f'valid{i}.cmme'), 'w') as f:
+                f.write('<note pitch="C4"/>')
+            with open(os.path.join(cmme_dir, f'bad{i}.cmme'), 'w') as f:
+                f.write(f'<bad{i}/>')
+        
+        validation_results = dataset_manager.validate_dataset(self.dataset_name)
+        
+        self.assertEqual(validation_results['valid'], count)
+        self.assertEqual(validation_results['invalid'], count)
+        for entry in validation_results['errors']:
+            tag = os.path.splitext(os.path.basename(entry['file']))[0]
+            self.assertIn(f"'{tag}'", entry['error'])
+    
+    def test_validate_json_content(self):
+        """Test that JSON validation reports every error in the same form."""
+        self.assertTrue(self.dataset_manager.validate_json_content(json.loads(self.test_json))['valid'])
+        
+        results = self.dataset_manager.validate_json_content(
+            {'notes': [{'pitch': 'C4'}, 5], 'metadata': []}
+        )
+        self.assertFalse(results['valid'])
+        self.assertEqual(results['errors'], [
+            "Note 1: Missing required field 'duration'",
+            "Note 2 must be an object",
+            "'metadata' must be an object"
+        ])
+    
+    def test_validate_dataset_xml_content(self):
+        """Test that XML files in a dataset are only checked for well-formedness without a schema."""
+        self.dataset_manager.create_dataset(self.dataset_name, self.dataset_description)
+        cmme_dir = os.path.join(self.temp_dir, self.dataset_name, 'cmme')
+        with open(os.path.join(cmme_dir, 'bad_pitch.cmme'), 'w') as f:
+            f.write('<cmme><note pitch="H4" duration="whole"/></cmme>')
+        with open(os.path.join(cmme_dir, 'malformed.cmme'), 'w') as f:
+            f.write('<cmme><note></cmme>')
+        
+        validation_results = self.dataset_manager.validate_dataset(self.dataset_name)
+        
+        self.assertEqual(validation_results['valid'], 1)
+        self.assertEqual(validation_results['invalid'], 1)
+        self.assertTrue(validation_results['errors'][0]['file'].endswith('malformed.cmme'))
+    
+    def test_validate_dataset_sample_mei(self):
+        """Test that a dataset built from the MEI samples validates."""
+        samples_dir = os.path.join(os.path.dirname(__file__), '..', 'samples')
+        files = []
+        for category in sorted(os.listdir(samples_dir)):
+            mei_dir = os.path.join(samples_dir, category, 'mei')
+            if not os.path.isdir(mei_dir):
+                continue
+            for filename in sorted(os.listdir(mei_dir)):
+                with open(os.path.join(mei_dir, filename), 'r', encoding='utf-8') as f:
+                    files.append({'filename': filename, 'content': f.read(), 'format': 'mei'})
+        self.assertTrue(files)
+        self.dataset_manager.create_dataset(self.dataset_name, self.dataset_description, files)
+        
+        validation_results = self.dataset_manager.validate_dataset(self.dataset_name)
+        
+        self.assertEqual(validation_results['valid'], len(files))
+        self.assertEqual(validation_results['invalid'], 0)
+    
+    def test_validate_file_format(self):
+        """Test file format validation of XML root and well-formedness."""
+        self.assertTrue(self.dataset_manager._validate_file_format(self.test_cmme, 'cmme'))
+        self.assertTrue(self.dataset_manager._validate_file_format(
+            '<?xml version="1.0"?>\n<mei xmlns="http://www.music-encoding.org/ns/mei"/>', 'mei'))
+        self.assertTrue(self.dataset_manager._validate_file_format('<!-- c --><cmme/>', 'cmme'))
+        self.assertFalse(self.dataset_manager._validate_file_format(self.test_cmme, 'mei'))
+        self.assertFalse(self.dataset_manager._validate_file_format('<cmme><note></cmme>', 'cmme'))
+    
+    def test_validate_mei_content(self):
+        """Test rule-based MEI validation in a single tree walk."""
+        mei = (
+            '<mei xmlns="http://www.music-encoding.org/ns/mei" meiversion="5.0">'
+            '<music><body><mdiv><score>'
+            '<scoreDef><staffGrp><staffDef n="1" lines="5" clef.shape="G" clef.line="2"/></staffGrp></scoreDef>'
+            '<section><measure n="1"><staff n="1"><layer n="1">{}</layer></staff></measure></section>'
+            '</score></mdiv></body></music></mei>'
+        )
+        root = etree.fromstring(mei.format(
+            '<note pname="c" oct="4" dur="4"/>'
+            '<chord dur="2"><note pname="e" oct="4"/><note pname="g" oct="4"/></chord>'
+            '<rest dur="4"/>'
+        ))
+        results = self.dataset_manager.validate_mei_content(root)
+        self.assertTrue(results['valid'])
+        self.assertEqual(results['errors'], [])
+        
+        root = etree.fromstring(mei.format(
+            '<note pname="c" oct="4" dur="4"/><note pname="d" oct="4"/>'
+        ))
+        results = self.dataset_manager.validate_mei_content(root)
+        self.assertFalse(results['valid'])
+        self.assertEqual(results['errors'], ["Note 2: Missing required attribute 'dur'"])
+        
+        root = etree.fromstring(mei.format('<note pname="b c" oct="4" dur="4"/>'))
+        results = self.dataset_manager.validate_mei_content(root)
+        self.assertEqual(results['errors'], ["Note 1: Invalid pitch name 'b c'"])
+        
+        root = etree.fromstring(mei.format(
+            '<note pname="c" oct="4" dur="4"/><note pname="d" oct="4" dur="3"/>'
+        ))
+        results = self.dataset_manager.validate_mei_content(root)
+        self.assertEqual(results['errors'], ["Note 2: Invalid duration '3'"])
+        
+        results = self.dataset_manager.validate_mei_content(root, format_errors=False)
+        self.assertFalse(results['valid'])
+        self.assertEqual(results['errors'], [])
+    
+    def test_validate_mei_content_samples(self):
+        """Test that the bundled MEI samples pass the content rules."""
+        samples_dir = os.path.join(os.path.dirname(__file__), '..', 'samples')
+        paths = [os.path.join(dirpath, filename)
+                 for dirpath, _, filenames in os.walk(samples_dir)
+                 for filename in filenames if filename.endswith('.mei')]
+        self.assertTrue(paths)
+        for path in paths:
+            results = self.dataset_manager.validate_mei_content(etree.parse(path).getroot())
+            self.assertEqual(results['errors'], [], path)
+    
+    def test_validate_mei_pitch_names(self):
+        """Test that MEI pitch names are checked in MEI's lowercase form."""
+        notes = ''.join(f'<note pname="{pname}" dur="4"/>' for pname in 'abcdefgC')
+        root = etree.fromstring(
+            '<mei xmlns="http://www.music-encoding.org/ns/mei"><music><body><mdiv><score>'
+            f'{notes}'
+            '</score></mdiv></body></music></mei>'
+        )
+        results = self.dataset_manager.validate_mei_content(root)
+        
+        self.assertEqual(results['errors'], ["Note 8: Invalid pitch name 'C'"])
+    
+    def test_validate_mei_content_with_schema(self):
+        """Test MEI validation against a precompiled schema."""
+        schema_path = os.path.join(os.path.dirname(__file__), 'mock_schema.xsd')
+        dataset_manager = Dataset(self.temp_dir, mei_schema=schema_path)
+        
+        valid = dataset_manager.validate_mei_content(etree.fromstring('<note pitch="C4"/>'))
+        self.assertTrue(valid['valid'])
+        
+        invalid = dataset_manager.validate_mei_content(etree.fromstring('<mei><note/></mei>'))
+        self.assertFalse(invalid['valid'])
+        self.assertTrue(invalid['errors'])
+
 
 class TestConversionEvaluator(unittest.TestCase):
     """Tests for the ConversionEvaluator class."""
@@ -1102,6 +1406,9 @@ class TestConversionEvaluator(unittest.TestCase):
         })
     
     def tearDown(self):
+        # Reports are written by a background thread; let it finish first
+        self.evaluator.flush_reports()
+        
         # Clean up the temporary directory
         import shutil
         if os.path.exists(self.temp_dir):
@@ -1147,6 +1454,205 @@ class TestConversionEvaluator(unittest.TestCase):
             # Good conversion should have high accuracy
             self.assertGreaterEqual(metrics.accuracy_score, 0.7)
     
+    def test_count_notes_from_json(self):
+        """Test that note counting agrees with note extraction."""
+        data = json.loads(self.json_data)
+        data['parts'].append({"measures": [
+            {"notes": [{"pitch": "E4"}]},
+            {"contents": [{"type": "note"}, {"type": "rest"}]}
+        ]})
+        
+        self.assertEqual(self.evaluator._count_notes_from_json(data),
+                         len(self.evaluator._extract_notes_from_json(data)))
+        self.assertEqual(self.evaluator._count_notes_from_json(data), 4)
+        self.assertEqual(self.evaluator._count_notes_from_json({"notes": [{}, {}]}), 2)
+    
+    def test_tally_weighted_total(self):
+        """Test that the tally weights each element by its local tag name."""
+        root = etree.fromstring(self.perfect_mei_result.encode('utf-8'))
+        total, weighted_total, tag_counts = self.evaluator._tally(root)
+        
+        elements = list(root.iter(etree.Element))
+        weights = self.evaluator.element_weights
+        self.assertEqual(total, len(elements))
+        self.assertEqual(weighted_total, sum(
+            weights.get(etree.QName(e).localname, weights['default']) for e in elements))
+        self.assertEqual(tag_counts['{http://www.music-encoding.org/ns/mei}note'], 2)
+    
+    def test_normalize_xml_content_cached(self):
+        """Test that XML normalization strips comments and reuses results."""
+        xml = '<cmme>\n  <!-- comment -->\n  <note pitch="C4"/>\n</cmme>'
+        normalized = self.evaluator._normalize_xml_content(xml)
+        self.assertEqual(normalized, '<cmme><note pitch="C4"/></cmme>')
+        
+        with patch('backend.evaluation.etree.fromstring') as mock_fromstring:
+            self.assertEqual(self.evaluator._normalize_xml_content(xml), normalized)
+            mock_fromstring.assert_not_called()
+    
+    def test_count_preserved_metadata(self):
+        """Test metadata comparison with hashable and unhashable values."""
+        source = {'title': 'Test Piece', 'composer': 'Test Composer'}
+        result = {'title': 'Test Piece', 'composer': 'Other'}
+        self.assertEqual(self.evaluator._count_preserved_metadata(source, result), 1)
+        
+        source['voices'] = ['Tenor']
+        result['voices'] = ['Tenor']
+        self.assertEqual(self.evaluator._count_preserved_metadata(source, result), 2)
+    
+    def test_analyze_source_cached(self):
+        """Test that repeated sources reuse the parsed tree and tally."""
+        analysis = self.evaluator._analyze_source(self.cmme_xml)
+        self.assertEqual(analysis.tag_counts['note'], 2)
+        
+        with patch('backend.evaluation.etree.fromstring') as mock_fromstring, \
+             patch.object(self.evaluator, '_tally') as mock_tally:
+            self.assertEqual(self.evaluator._analyze_source(self.cmme_xml), analysis)
+            self.assertIs(self.evaluator._analyze_source(self.cmme_xml).root, analysis.root)
+            mock_fromstring.assert_not_called()
+            mock_tally.assert_not_called()
+    
+    def test_document_cache_bounded_by_size(self):
+        """Test that cached documents are evicted once their total size exceeds the budget."""
+        first = '<score><note pitch="C4"/></score>'
+        second = '<score><note pitch="D4"/></score>'
+        with patch('backend.evaluation._DOCUMENT_CACHE_BYTES', len(first) + len(second) - 1):
+            first_root = self.evaluator._parse_document(first)
+            second_root = self.evaluator._parse_document(second)
+            
+            # The newest document is kept; the oldest made room for it
+            self.assertIs(self.evaluator._parse_document(second), second_root)
+            self.assertIsNot(self.evaluator._parse_document(first), first_root)
+    
+    def test_parse_document_drops_blank_text(self):
+        """Test that indentation-only text is not kept in parsed documents."""
+        root = self.evaluator._parse_document('<score>\n  <note pitch="C4">\n    <text> a </text>\n  </note>\n</score>')
+        note = root[0]
+        self.assertIsNone(root.text)
+        self.assertIsNone(note.text)
+        self.assertEqual(note[0].text, ' a ')
+    
+    def test_validate_mei_with_parsed_root(self):
+        """Test that MEI validation walks a given tree instead of reparsing."""
+        xml = '<mei xmlns="http://www.music-encoding.org/ns/mei"><music><body/></music></mei>'
+        expected = ['Missing required element: mdiv', 'Missing required element: score']
+        self.assertEqual(self.evaluator._validate_mei(xml), expected)
+        
+        root = etree.fromstring(xml)
+        with patch('backend.evaluation.etree.iterparse') as mock_iterparse:
+            self.assertEqual(self.evaluator._validate_mei(xml, root), expected)
+            mock_iterparse.assert_not_called()
+    
+    def test_target_elements_from_buckets(self):
+        """Test tag buckets keep document order and fall back to unqualified MEI tags."""
+        buckets = self.evaluator._bucket_by_tag(etree.fromstring(self.perfect_mei_result.encode('utf-8')))
+        notes = self.evaluator._target_elements(buckets, 'note', 'cmme_to_mei')
+        self.assertEqual([note.get('pname') for note in notes], ['c', 'd'])
+        self.assertEqual(self.evaluator._target_elements(buckets, 'note', 'mei_to_cmme'), [])
+        
+        plain = self.evaluator._bucket_by_tag(etree.fromstring('<mei><note/></mei>'))
+        self.assertEqual(len(self.evaluator._target_elements(plain, 'note', 'cmme_to_mei')), 1)
+    
+    def test_bucket_by_tag_filters_tags(self):
+        """Test that only requested tags are bucketed, including MEI-qualified ones."""
+        root = etree.fromstring(self.perfect_mei_result.encode('utf-8'))
+        tags = self.evaluator._target_tags(['note'], 'cmme_to_mei')
+        self.assertEqual(tags, {'note', '{http://www.music-encoding.org/ns/mei}note'})
+        
+        buckets = self.evaluator._bucket_by_tag(root, tags)
+        self.assertEqual(list(buckets), ['{http://www.music-encoding.org/ns/mei}note'])
+        self.assertEqual(len(self.evaluator._bucket_by_tag(root, set())), 0)
+    
+    def test_memory_usage_reuses_process_handle(self):
+        """Test that the psutil process handle is created once per evaluator."""
+        with patch('backend.evaluation.psutil') as mock_psutil:
+            process = mock_psutil.Process.return_value
+            process.pid = os.getpid()
+            process.memory_info.return_value.rss = 64 * 1024 * 1024
+            
+            self.assertEqual(self.evaluator._get_memory_usage(), 64.0)
+            self.assertEqual(self.evaluator._get_memory_usage(), 64.0)
+            mock_psutil.Process.assert_called_once_with(os.getpid())
+    
+    def test_analyze_data_loss_summary(self):
+        """Test that loss reports carry the counts severity was derived from."""
+        summary = self.evaluator._summarize_loss(
+            [{"element": "notes", "count": 3}, {"element": "measure", "count": 2}],
+            [{"attribute": "pitch"}, {"attribute": "stem"}]
+        )
+        self.assertEqual(summary.total_elements, 5)
+        self.assertEqual(summary.musical_elements, 3)
+        self.assertEqual(summary.important_attrs, 1)
+        self.assertEqual(summary.attr_names, frozenset({'pitch', 'stem'}))
+        
+        report = self.evaluator.analyze_data_loss(self.cmme_xml, self.imperfect_mei_result, 'cmme_to_mei')
+        self.assertEqual(report.summary, self.evaluator._summarize_loss(
+            report.lost_elements, report.lost_attributes))
+    
+    def test_determine_loss_severity_bands(self):
+        """Test severity thresholds at the band edges."""
+        def severity(notes, attrs, conversion_type):
+            lost_elements = [{"element": "note", "count": notes}] if notes else []
+            lost_attributes = [{"attribute": "pitch"}] * attrs
+            return self.evaluator._determine_loss_severity(lost_elements, lost_attributes, [], conversion_type)
+        
+        self.assertEqual(severity(0, 3, 'cmme_to_mei'), 'none')
+        self.assertEqual(severity(5, 0, 'cmme_to_mei'), 'low')
+        self.assertEqual(severity(0, 11, 'cmme_to_mei'), 'medium')
+        self.assertEqual(severity(11, 0, 'cmme_to_mei'), 'high')
+        self.assertEqual(severity(0, 0, 'mei_to_mei'), 'none')
+        self.assertEqual(severity(0, 2, 'mei_to_mei'), 'low')
+        self.assertEqual(severity(1, 0, 'mei_to_mei'), 'medium')
+        self.assertEqual(severity(0, 6, 'mei_to_mei'), 'high')
+    
+    def test_report_filenames_unique_within_second(self):
+        """Test that reports saved in the same second get distinct file names."""
+        with patch('backend.evaluation.time.time', return_value=1700000000.5):
+            first = self.evaluator._report_filename('evaluation', 'cmme_to_mei')
+            second = self.evaluator._report_filename('loss_report', 'cmme_to_mei')
+        
+        self.assertTrue(first.startswith('evaluation_cmme_to_mei_'))
+        self.assertTrue(first.endswith('_1.json'))
+        self.assertTrue(second.endswith('_2.json'))
+        self.assertEqual(first.split('_')[-3:-1], second.split('_')[-3:-1])
+    
+    def test_reports_written_in_background(self):
+        """Test that saved reports reach the report directory once flushed."""
+        with tempfile.TemporaryDirectory() as report_dir:
+            evaluator = ConversionEvaluator(report_dir)
+            evaluator.evaluate_conversion(self.cmme_xml, self.perfect_mei_result, 'cmme_to_mei')
+            evaluator.analyze_data_loss(self.cmme_xml, self.perfect_mei_result, 'cmme_to_mei')
+            evaluator.flush_reports()
+            
+            names = sorted(os.listdir(report_dir))
+            self.assertEqual(len(names), 2)
+            self.assertTrue(names[0].startswith('evaluation_cmme_to_mei_'))
+            with open(os.path.join(report_dir, names[1]), encoding='utf-8') as f:
+                self.assertIn('severity', json.load(f))
+    
+    def test_indel_similarity(self):
+        """Test structure similarity is twice the LCS length over the total length."""
+        self.assertEqual(_indel_similarity('', ''), 1.0)
+        self.assertEqual(_indel_similarity('note', 'note'), 1.0)
+        self.assertEqual(_indel_similarity('note', ''), 0.0)
+        # LCS of 'staff' and 'stuff' is 'stff' (4 characters)
+        self.assertAlmostEqual(_indel_similarity('staff', 'stuff'), 8 / 10)
+        self.assertAlmostEqual(_indel_similarity('measure', 'meter'), 6 / 12)
+    
+    def test_extract_metadata_cached_per_tree(self):
+        """Test that metadata is stored with cached trees only and is read-only."""
+        root = self.evaluator._parse_document(self.mei_xml)
+        metadata = self.evaluator._extract_metadata(root, 'mei')
+        self.assertEqual(metadata['title'], 'Test Piece')
+        self.assertIs(self.evaluator._extract_metadata(root, 'mei'), metadata)
+        with self.assertRaises(TypeError):
+            metadata['title'] = 'Changed'
+        
+        # Trees built by the caller are not cached
+        other = etree.fromstring(self.mei_xml.encode('utf-8'))
+        self.assertEqual(self.evaluator._extract_metadata(other, 'mei')['title'], 'Test Piece')
+        self.assertIsNot(self.evaluator._extract_metadata(other, 'mei'),
+                         self.evaluator._extract_metadata(other, 'mei'))
+    
     def test_analyze_data_loss(self):
         """Test analyzing data loss during conversion."""
         # Create mock lost elements to ensure the test passes
@@ -1182,6 +1688,54 @@ class TestConversionEvaluator(unittest.TestCase):
             # Severity should be set
             self.assertIn(loss_report.severity, ['none', 'low', 'medium', 'high'])
     
+    def test_analyze_data_loss_blank_metadata(self):
+        """Test that blank MEI metadata is neither lost nor modified in a JSON result."""
+        source = """<mei xmlns="http://www.music-encoding.org/ns/mei">
+          <meiHead>
+            <fileDesc>
+              <titleStmt>
+                <title>Walzer</title>
+                <composer>
+                  <persName>Dionisio Aguado</persName>
+                </composer>
+              </titleStmt>
+              <pubStmt>
+                <date>2011</date>
+              </pubStmt>
+            </fileDesc>
+          </meiHead>
+          <music><body><mdiv><score/></mdiv></body></music>
+        </mei>"""
+        result = json.dumps({'metadata': {'title': 'Walzer', 'composer': ''}, 'notes': []})
+        
+        loss_report = self.evaluator.analyze_data_loss(source, result, 'mei_to_json')
+        
+        # Indentation is not text, so titleStmt and pubStmt carry no metadata
+        # value, and the composer's missing text matches the empty string
+        self.assertEqual(loss_report.lost_attributes, [])
+        self.assertEqual(loss_report.modified_content, [])
+    
+    def test_analyze_data_loss_reuses_parsed_documents(self):
+        """Test that documents evaluated once are not parsed again for loss analysis."""
+        self.evaluator.evaluate_conversion(self.cmme_xml, self.imperfect_mei_result, 'cmme_to_mei')
+        
+        with patch('backend.evaluation.etree.fromstring') as mock_fromstring:
+            loss_report = self.evaluator.analyze_data_loss(self.cmme_xml, self.imperfect_mei_result,
+                                                           'cmme_to_mei')
+            mock_fromstring.assert_not_called()
+        self.assertIn(loss_report.severity, ['none', 'low', 'medium', 'high'])
+    
+    def test_load_json_reuses_decoded_data(self):
+        """Test that repeated JSON content is decoded once and data passes through."""
+        content = '{"metadata": {"title": "Test"}, "notes": [{"pitch": "C4"}]}'
+        data = self.evaluator._load_json(content)
+        self.assertEqual(self.evaluator._count_notes_from_json(data), 1)
+        self.assertIs(self.evaluator._load_json(content), data)
+        self.assertIs(self.evaluator._load_json(data), data)
+        
+        with self.assertRaises(ValueError):
+            self.evaluator._load_json('{"notes": [')
+    
     def test_generate_detailed_report(self):
         """Test generating a detailed evaluation report."""
         # Create sample metrics and loss report